@@ -16,18 +16,24 @@ logger = get_logger("run_discord_bot")
 
 # Global bot reference for shutdown
 _bot = None
+_shutting_down = False
 
 
 def signal_handler(sig, frame):
     """Handle shutdown signals gracefully"""
+    global _shutting_down
     logger.info(f"Received signal {sig}. Initiating graceful shutdown...")
     
-    if _bot:
+    if _bot and not _shutting_down:
         try:
             logger.info("Closing Discord bot connection...")
-            # Schedule the close coroutine
-            asyncio.create_task(_bot.bot.close())
-            logger.info("Discord bot closed successfully")
+            # bot.start() returns once closed, then main() flushes writes and
+            # snapshots the cache before the process exits
+            asyncio.get_running_loop().create_task(_bot.bot.close())
+            _shutting_down = True
+            return
+        except RuntimeError:
+            pass  # Loop not running yet (or already gone)
         except Exception as e:
             logger.error(f"Error closing bot: {e}")
     
@@ -49,11 +55,18 @@ async def main():
     _bot = TranslationDiscordBot()
     logger.info("✅ Discord bot initialized")
     
+    # Warm the translation cache from the last snapshot in the background
+    await _bot.handler.start()
+    
     try:
         await _bot.bot.start(get_bot_token())
     except Exception as e:
         logger.error(f"Fatal error in Discord bot: {e}", exc_info=True)
         raise
+    finally:
+        # Flush pending translation writes and snapshot the cache
+        # (also runs when asyncio.run cancels us on exit)
+        await _bot.handler.shutdown()
 
 
 def get_bot_token():
@@ -22,12 +22,13 @@ def signal_handler(sig, frame):
     """Handle shutdown signals gracefully"""
     logger.info(f"Received signal {sig}. Initiating graceful shutdown...")
     
-    if _bot:
+    if _bot and _bot.application.running:
         try:
             logger.info("Stopping Telegram bot...")
-            # Stop the bot application
-            _bot.application.stop()
-            logger.info("Telegram bot stopped successfully")
+            # run_polling() returns after shutting down, which flushes
+            # translation writes and snapshots the cache (post_shutdown)
+            _bot.application.stop_running()
+            return
         except Exception as e:
             logger.error(f"Error stopping bot: {e}")
     
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Benchmark translation cache memory footprint and throughput"""
+
+import argparse
+import hashlib
+import random
+import sys
+import time
+import tracemalloc
+from collections import OrderedDict
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.cache_service import SimpleCacheService
+
+
+WORDS = (
+    "hello world good morning thank you very much see you later how are you "
+    "please help me with this message the meeting starts at noon tomorrow "
+    "let us know if anything changes we will send the report tonight"
+).split()
+
+LANGUAGE_PAIRS = [("en", "es"), ("en", "fr"), ("en", "de"), ("en", "ja"), ("es", "en")]
+
+
+def make_workload(count: int, seed: int = 42):
+    """Chat-like texts: mostly short phrases, with some long paragraphs"""
+    rng = random.Random(seed)
+    workload = []
+    for i in range(count):
+        length = rng.randint(40, 120) if rng.random() < 0.05 else rng.randint(2, 12)
+        text = " ".join(rng.choice(WORDS) for _ in range(length)) + f" #{i}"
+        source, target = rng.choice(LANGUAGE_PAIRS)
+        translation = " ".join(reversed(text.split()))
+        workload.append((text, source, target, translation))
+    return workload
+
+
+class BaselineCache:
+    """
+    The previous entry layout in the same structures: md5 hex keys and
+    (value, timestamp, size, pair) tuples in an ordered dict, plus the
+    expiry wheel slot
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._wheel = {}
+
+    def set(self, text, source_lang, target_lang, translation):
+        key = hashlib.md5(f"{text}:{source_lang}:{target_lang}".encode()).hexdigest()
+        now = time.time()
+        size = len(translation.encode("utf-8")) + 200
+        self._entries[key] = (translation, now, size, f"{source_lang}->{target_lang}")
+        self._wheel.setdefault(int((now + 86400) // 60), set()).add(key)
+
+
+def measure_bytes_per_entry(factory, workload) -> float:
+    """Traced allocation growth per entry while filling a fresh cache"""
+    tracemalloc.start()
+    cache = factory()
+    before = tracemalloc.get_traced_memory()[0]
+
+    for text, source, target, translation in workload:
+        # Fresh copy, as if just returned by a provider, so retained values are counted
+        cache.set(text, source, target, translation.encode("utf-8").decode("utf-8"))
+
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(workload)
+
+
+def measure_throughput(cache: SimpleCacheService, workload) -> tuple:
+    """Microseconds per set and per get"""
+    start = time.perf_counter()
+    for text, source, target, translation in workload:
+        cache.set(text, source, target, translation)
+    set_us = (time.perf_counter() - start) / len(workload) * 1e6
+
+    start = time.perf_counter()
+    for text, source, target, _ in workload:
+        cache.get(text, source, target)
+    get_us = (time.perf_counter() - start) / len(workload) * 1e6
+
+    return set_us, get_us
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=200000, help="Number of cached translations")
+    args = parser.parse_args()
+
+    workload = make_workload(args.entries)
+    payload = sum(len(translation.encode("utf-8")) for *_, translation in workload) / len(workload)
+
+    def compact_factory():
+        return SimpleCacheService(
+            max_entries=args.entries * 2,
+            max_bytes=1 << 40,
+            use_l2=False
+        )
+
+    print(f"📊 Cache benchmark: {args.entries} entries, {payload:.0f} bytes of translation each on average")
+
+    baseline = measure_bytes_per_entry(BaselineCache, workload)
+    compact = measure_bytes_per_entry(compact_factory, workload)
+    print(f"  Before (md5 hex keys, tuples):      {baseline:8.1f} bytes/entry")
+    print(f"  After  (digest keys, slots, zlib):  {compact:8.1f} bytes/entry")
+    print(f"  Saved: {(1 - compact / baseline) * 100:.1f}%")
+
+    cache = compact_factory()
+    set_us, get_us = measure_throughput(cache, workload)
+    stats = cache.get_stats()
+    print(f"  set: {set_us:.2f}µs/op, get: {get_us:.2f}µs/op")
+    print(f"  Compressed entries: {stats['compressed_entries']}, accounted {stats['bytes_per_entry']:.1f} bytes/entry")
+
+
+if __name__ == "__main__":
+    main()
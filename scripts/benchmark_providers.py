@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Benchmark provider HTTP calls: a new client per call vs pooled warm connections"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.provider_clients import ProviderClientManager
+from src.services.translation_providers import LibreTranslateProvider
+
+
+class StandInServer:
+    """
+    Minimal keep-alive HTTP/1.1 server speaking the LibreTranslate /translate API
+
+    connect_delay emulates the extra round trips of a TCP + TLS handshake to a
+    remote upstream; it is paid once per new connection.
+    """
+
+    def __init__(self, connect_delay: float):
+        self.connect_delay = connect_delay
+        self.connections = 0
+        self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        await asyncio.sleep(self.connect_delay)
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                headers = dict(
+                    line.split(": ", 1) for line in head.decode().split("\r\n")[1:] if ": " in line
+                )
+                length = int(next((v for k, v in headers.items() if k.lower() == "content-length"), 0))
+                payload = json.loads(await reader.readexactly(length)) if length else {}
+
+                body = json.dumps({"translatedText": payload.get("q", "")[::-1]}).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+
+def summarize(label: str, latencies, connections: int):
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"  {label:<28} p50 {p50:7.2f}ms   p95 {p95:7.2f}ms   connections opened: {connections}")
+
+
+async def run(calls: int, connect_delay_ms: float):
+    server = StandInServer(connect_delay_ms / 1000)
+    endpoint = await server.start()
+
+    print(f"📊 Provider benchmark: {calls} sequential translations against {endpoint}")
+    print(f"   (stand-in adds {connect_delay_ms:.0f}ms per new connection to emulate TCP + TLS setup)\n")
+
+    # Before: a fresh AsyncClient for every call
+    latencies = []
+    for i in range(calls):
+        start = time.perf_counter()
+        async with httpx.AsyncClient() as client:
+            response = await client.post(f"{endpoint}/translate", json={"q": f"hello {i}", "source": "en", "target": "es"})
+            response.raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+    summarize("new client per call", latencies, server.connections)
+
+    # After: the provider with a pooled, long-lived client
+    server.connections = 0
+    os.environ["LIBRETRANSLATE_ENDPOINT"] = endpoint
+    clients = ProviderClientManager({"http2": False})
+    provider = LibreTranslateProvider(clients)
+    await clients.start([provider.client_name])
+
+    latencies = []
+    for i in range(calls):
+        start = time.perf_counter()
+        await provider.translate(f"hello {i}", "en", "es")
+        latencies.append((time.perf_counter() - start) * 1000)
+    summarize("pooled client (warm)", latencies, server.connections)
+
+    await clients.aclose()
+    await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200, help="Translations per scenario")
+    parser.add_argument("--connect-delay-ms", type=float, default=20.0, help="Emulated handshake cost per connection")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.calls, args.connect_delay_ms))
+
+
+if __name__ == "__main__":
+    main()
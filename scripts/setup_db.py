@@ -21,6 +21,7 @@ async def main():
     # Initialize database
     db = DatabaseService()
     await db.initialize()
+    await db.close()
     
     print("✅ Database initialized!")
     print("💰 Cost: $0 - FREE forever!")
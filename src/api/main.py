@@ -4,6 +4,7 @@ FastAPI Application
 Main FastAPI application with all routes
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, FileResponse
@@ -24,10 +25,22 @@ if sentry_dsn:
 else:
     logger.warning("⚠️  Sentry not configured. Error tracking disabled.")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and graceful shutdown"""
+    await translation.start_bot()
+    yield
+    
+    logger.info("Flushing pending translation writes and snapshotting the cache...")
+    await translation.shutdown_bot()
+
+
 app = FastAPI(
     title="ROMA Translation Bot",
     description="Intelligent translation API powered by ROMA framework and Hugging Face",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -109,6 +122,8 @@ async def root():
         "cost": "$0 - Completely FREE!",
         "endpoints": {
             "translate": "POST /api/v1/translate",
+            "translate_stream": "POST /api/v1/translate/stream",
+            "translate_batch": "POST /api/v1/translate/batch",
             "detect": "POST /api/v1/detect",
             "transcribe": "POST /api/v1/transcribe",
             "voice_translate": "POST /api/v1/voice-translate",
@@ -42,6 +42,45 @@ class TranslationRequest(BaseModel):
     )
 
 
+class BatchTranslationRequest(BaseModel):
+    """Batch translation request model"""
+    texts: List[str] = Field(
+        ...,
+        min_items=1,
+        max_items=1000,
+        description="Texts to translate (identical texts are translated once)"
+    )
+    target_languages: List[str] = Field(
+        ...,
+        min_items=1,
+        max_items=5,
+        description="Target languages shared by all texts (max 5)"
+    )
+    source_language: Optional[str] = Field(
+        None,
+        description="Source language (auto-detected per text if not provided)"
+    )
+    preserve_formatting: bool = Field(
+        True,
+        description="Preserve formatting in translation"
+    )
+    stream: bool = Field(
+        False,
+        description="Stream results as JSON lines (always used for large batches)"
+    )
+    
+    @field_validator('texts')
+    @classmethod
+    def validate_texts(cls, v):
+        """Validate every text contains some actual content"""
+        for index, text in enumerate(v):
+            if not text or not text.strip():
+                raise ValueError(f"Text at index {index} cannot be empty")
+            if len(text) > 10000:
+                raise ValueError(f"Text at index {index} exceeds 10000 characters")
+        return v
+
+
 class LanguageDetectionRequest(BaseModel):
     """Language detection request model"""
     text: str = Field(
@@ -5,7 +5,7 @@ Pydantic models for API responses
 """
 
 from pydantic import BaseModel
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 
 class TranslationResponse(BaseModel):
@@ -16,9 +16,18 @@ class TranslationResponse(BaseModel):
     quality_scores: Dict[str, float]
     processing_time_ms: int
     cached: bool
+    cached_languages: Dict[str, bool] = {}
     metadata: Dict[str, Any]
 
 
+class BatchTranslationResponse(BaseModel):
+    """Batch translation response model"""
+    results: List[Dict[str, Any]]
+    total: int
+    unique_texts: int
+    processing_time_ms: int
+
+
 class LanguageDetectionResponse(BaseModel):
     """Language detection response model"""
     language: str
@@ -33,6 +42,7 @@ class HealthResponse(BaseModel):
     model: str
     cost: str
     limits: Dict[str, Any]
+    circuit_breakers: Dict[str, Any] = {}
 
 
 class ErrorResponse(BaseModel):
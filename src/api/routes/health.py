@@ -5,22 +5,12 @@ API routes for health check and status
 """
 
 from fastapi import APIRouter
-from ...core.translation_agent import TranslationBot
+from .translation import get_bot
 from ..models.response import HealthResponse
+from ...utils.error_recovery import get_circuit_breaker_stats
 
 router = APIRouter(prefix="/api/v1", tags=["health"])
 
-# Initialize bot (will be initialized once)
-_bot: TranslationBot = None
-
-
-def get_bot() -> TranslationBot:
-    """Get or create bot instance"""
-    global _bot
-    if _bot is None:
-        _bot = TranslationBot()
-    return _bot
-
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
@@ -34,8 +24,15 @@ async def health_check():
         if hasattr(bot, 'translation_service') and bot.translation_service.enabled_providers:
             provider_name = bot.translation_service.enabled_providers[0].name
 
+        # Degraded when every provider with quota is behind an open breaker
+        breakers = get_circuit_breaker_stats()
+        enabled = bot.translation_service.enabled_providers if hasattr(bot, 'translation_service') else []
+        all_open = bool(enabled) and all(
+            breakers.get(p.client_name, {}).get("state") == "open" for p in enabled
+        )
+
         return HealthResponse(
-            status="healthy",
+            status="degraded" if all_open else "healthy",
             provider=provider_name,
             model="ROMA Framework",
             cost="$0 - FREE forever!",
@@ -43,7 +40,8 @@ async def health_check():
                 "max_text_length": 10000,
                 "max_languages": 10,
                 "providers": len(bot.translation_service.enabled_providers) if hasattr(bot, 'translation_service') else 0
-            }
+            },
+            circuit_breakers=breakers
         )
     except Exception as e:
         return HealthResponse(
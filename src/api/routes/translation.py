@@ -4,10 +4,17 @@ Translation Routes
 API routes for translation endpoints
 """
 
+import json
+import time
+import uuid
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from sse_starlette.sse import EventSourceResponse
 from ...core.translation_agent import TranslationBot
-from ..models.request import TranslationRequest, LanguageDetectionRequest
-from ..models.response import TranslationResponse, LanguageDetectionResponse
+from ..models.request import TranslationRequest, BatchTranslationRequest, LanguageDetectionRequest
+from ..models.response import (
+    TranslationResponse, BatchTranslationResponse, LanguageDetectionResponse
+)
 
 router = APIRouter(prefix="/api/v1", tags=["translation"])
 
@@ -23,6 +30,17 @@ def get_bot() -> TranslationBot:
     return _bot
 
 
+async def start_bot():
+    """Create the shared bot and start its background work on application startup"""
+    await get_bot().start()
+
+
+async def shutdown_bot():
+    """Flush the shared bot's pending work on application shutdown"""
+    if _bot is not None:
+        await _bot.shutdown()
+
+
 @router.post("/translate", response_model=TranslationResponse)
 async def translate_text(request: TranslationRequest):
     """
@@ -48,6 +66,107 @@ async def translate_text(request: TranslationRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/translate/stream")
+async def translate_text_stream(request: TranslationRequest):
+    """
+    Translate text to multiple languages, streaming results as Server-Sent Events
+    
+    Emits one `translation` event per language as soon as it is ready,
+    followed by a final `done` event with request timing.
+    """
+    bot = get_bot()
+    
+    try:
+        bot.validate_request(request.text, request.target_languages)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    request_id = str(uuid.uuid4())
+    start_time = time.time()
+    
+    async def event_stream():
+        completed = 0
+        failed = 0
+        
+        try:
+            async for item in bot.translate_stream(
+                text=request.text,
+                target_languages=request.target_languages,
+                source_language=request.source_language,
+                preserve_formatting=request.preserve_formatting
+            ):
+                if item["success"]:
+                    completed += 1
+                else:
+                    failed += 1
+                
+                yield {
+                    "event": "translation",
+                    "data": json.dumps({"request_id": request_id, **item}, ensure_ascii=False)
+                }
+        except Exception as e:
+            yield {
+                "event": "error",
+                "data": json.dumps({"request_id": request_id, "error": str(e)})
+            }
+        
+        yield {
+            "event": "done",
+            "data": json.dumps({
+                "request_id": request_id,
+                "completed": completed,
+                "failed": failed,
+                "processing_time_ms": int((time.time() - start_time) * 1000)
+            })
+        }
+    
+    return EventSourceResponse(event_stream())
+
+
+@router.post("/translate/batch", response_model=BatchTranslationResponse)
+async def translate_batch(request: BatchTranslationRequest):
+    """
+    Translate many texts to the same target languages
+    
+    Identical texts are translated once and results are returned in input
+    order. Large batches (or stream=true) are returned as JSON lines.
+    """
+    bot = get_bot()
+    
+    try:
+        bot.validate_batch(request.texts, request.target_languages)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    start_time = time.time()
+    results = bot.translate_batch_iter(
+        texts=request.texts,
+        target_languages=request.target_languages,
+        source_language=request.source_language,
+        preserve_formatting=request.preserve_formatting
+    )
+    
+    batch_config = bot.config_loader.get_config().get("translation", {}).get("batch", {})
+    if request.stream or len(request.texts) > batch_config.get("stream_threshold", 25):
+        async def json_lines():
+            async for result in results:
+                yield json.dumps(result, ensure_ascii=False) + "\n"
+        
+        return StreamingResponse(json_lines(), media_type="application/x-ndjson")
+    
+    try:
+        collected = [result async for result in results]
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    return BatchTranslationResponse(
+        results=collected,
+        total=len(collected),
+        unique_texts=len(set(request.texts)),
+        processing_time_ms=int((time.time() - start_time) * 1000)
+    )
+
+
 @router.post("/detect", response_model=LanguageDetectionResponse)
 async def detect_language(request: LanguageDetectionRequest):
     """Detect language of text"""
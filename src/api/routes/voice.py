@@ -9,16 +9,16 @@ import tempfile
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
 from typing import List, Optional
 from ...services.hf_whisper_service import HFWhisperASR
-from ...core.translation_agent import TranslationBot
+from .translation import get_bot
 from ...utils.logger import get_logger
+from ...utils.thread_pools import get_executor
 
 logger = get_logger("voice_api")
 
 router = APIRouter(prefix="/api/v1", tags=["voice"])
 
-# Initialize services
+# Initialize services (translation bot is shared with the translation routes)
 asr = HFWhisperASR(enable_cache=True)
-translation_bot = TranslationBot()
 
 
 @router.post("/transcribe")
@@ -61,7 +61,7 @@ async def transcribe(
         
         try:
             # Transcribe
-            result = asr.transcribe_with_retry(tmp_file_path)
+            result = await get_executor("asr-io").run(asr.transcribe_with_retry, tmp_file_path)
             
             if not result.get("success"):
                 logger.warning(f"Transcription failed: {result.get('error')}")
@@ -152,7 +152,7 @@ async def voice_translate(
         try:
             # Step 1: Transcribe audio
             logger.info(f"[{request_id}] Starting transcription...")
-            asr_result = asr.transcribe_with_retry(tmp_file_path)
+            asr_result = await get_executor("asr-io").run(asr.transcribe_with_retry, tmp_file_path)
             
             if not asr_result.get("success"):
                 raise HTTPException(
@@ -166,7 +166,7 @@ async def voice_translate(
             
             # Step 2: Translate text
             logger.info(f"[{request_id}] Starting translation to {len(target_langs)} languages...")
-            translation_result = await translation_bot.translate(
+            translation_result = await get_bot().translate(
                 text=transcribed_text,
                 target_languages=target_langs,
                 source_language=source_language,
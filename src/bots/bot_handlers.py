@@ -5,11 +5,11 @@ Shared translation handlers for Discord and Telegram bots
 """
 
 import os
-import asyncio
 import tempfile
 from typing import Dict, List
 from ..core.translation_agent import TranslationBot
 from ..services.hf_whisper_service import HFWhisperASR
+from ..utils.thread_pools import get_executor
 
 
 class BotTranslationHandler:
@@ -19,6 +19,14 @@ class BotTranslationHandler:
         self.bot = TranslationBot()
         self.asr = HFWhisperASR(enable_cache=True)
     
+    async def start(self):
+        """Start translation background work when the bot process boots"""
+        await self.bot.start()
+    
+    async def shutdown(self):
+        """Flush translation state before the bot process exits"""
+        await self.bot.shutdown()
+    
     async def handle_translate_command(
         self,
         text: str,
@@ -104,7 +112,7 @@ class BotTranslationHandler:
         """
         try:
             # Run blocking transcription in thread pool to avoid blocking async event loop
-            result = await asyncio.to_thread(self.asr.transcribe_with_retry, audio_path)
+            result = await get_executor("asr-io").run(self.asr.transcribe_with_retry, audio_path)
             return result
         except Exception as e:
             return {
@@ -146,7 +154,7 @@ class BotTranslationHandler:
             
             # Step 1: Transcribe audio (run in thread pool to avoid blocking)
             logger.info(f"🎙️ Starting transcription...")
-            asr_result = await asyncio.to_thread(self.asr.transcribe_with_retry, audio_path)
+            asr_result = await get_executor("asr-io").run(self.asr.transcribe_with_retry, audio_path)
             
             if not asr_result.get("success"):
                 error = asr_result.get("error", "Transcription failed")
@@ -34,7 +34,13 @@ class TranslationTelegramBot:
             logger.warning("⚠️  Sentry not configured. Error tracking disabled.")
 
         self.handler = BotTranslationHandler()
-        self.application = Application.builder().token(self.token).build()
+        self.application = (
+            Application.builder()
+            .token(self.token)
+            .post_init(self._on_startup)
+            .post_shutdown(self._on_shutdown)
+            .build()
+        )
 
         self._setup_handlers()
     
@@ -386,6 +392,14 @@ Spanish, French, German, Italian, Portuguese, Russian, Japanese, Chinese, Korean
         self.application.add_handler(MessageHandler(filters.VOICE, voice_message_handler))
         setup_logger.info("✅ Voice handler registered successfully")
     
+    async def _on_startup(self, application: Application):
+        """Restore the translation cache in the background once the loop is running"""
+        await self.handler.start()
+    
+    async def _on_shutdown(self, application: Application):
+        """Flush pending translation writes and snapshot the cache when polling stops"""
+        await self.handler.shutdown()
+    
     def run(self):
         """Run the Telegram bot"""
         logger.info("🤖 Starting Telegram bot...")
@@ -30,6 +30,7 @@ def translate(text, to, source):
     async def run():
         try:
             bot = TranslationBot()
+            await bot.start()
             
             with Progress(
                 SpinnerColumn(),
@@ -47,6 +48,9 @@ def translate(text, to, source):
                     source_language=source
                 )
             
+            # Flush pending database writes before the event loop closes
+            await bot.shutdown()
+            
             # Display results
             console.print(f"\n[green]✓[/green] Translation complete!", style="bold")
             console.print(f"[dim]Source: {result['source_language']}")
@@ -93,6 +97,7 @@ def translate_file(file_path, to, source):
             console.print(f"[dim]Size: {len(text)} characters\n")
             
             bot = TranslationBot()
+            await bot.start()
             
             with Progress(
                 SpinnerColumn(),
@@ -109,6 +114,9 @@ def translate_file(file_path, to, source):
                     source_language=source
                 )
             
+            # Flush pending database writes before the event loop closes
+            await bot.shutdown()
+            
             # Save translations
             import os
             base_name = os.path.splitext(file_path)[0]
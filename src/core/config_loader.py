@@ -107,6 +107,8 @@ class ConfigLoader:
                 ),
             },
             "database": agent_config.get("database", {}),
+            "providers": agent_config.get("providers", {}),
+            "executors": agent_config.get("executors", {}),
             "languages": self.get_languages(),
             "models": self.get_model_config(),
         }
@@ -4,8 +4,9 @@ Real ROMA Framework Integration for Translation
 Uses sentient-agi/ROMA modules for intelligent parallel translation execution
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator
 import asyncio
+from ..utils.single_flight import translation_flights
 
 
 class TranslationROMA:
@@ -33,8 +34,32 @@ class TranslationROMA:
         # ROMA just handles the orchestration logic
         
         # For now, we'll use ROMA's pattern without LM for orchestration
-        # since we have our own translation providers
-        self.max_concurrent = 5
+        # since we have our own translation providers.
+        # Concurrency is bounded per provider by the translation service's
+        # adaptive limiters (seeded from roma.executor.max_concurrent), which
+        # are shared across requests.
+    
+    async def _translate_once(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str
+    ) -> Dict[str, Any]:
+        """
+        Call the translation service, coalescing identical in-flight requests
+        
+        Concurrent callers with the same (text, source, target) share a single
+        provider call, e.g. when a Discord channel and a Telegram group send
+        the same phrase at the same moment.
+        """
+        fingerprint = ("translate", text, source_lang, target_lang)
+        return await translation_flights.do(
+            fingerprint,
+            self.translation_service.translate,
+            text,
+            source_lang,
+            target_lang
+        )
     
     async def should_use_parallel(
         self,
@@ -107,7 +132,7 @@ class TranslationROMA:
             Translation result
         """
         try:
-            result = await self.translation_service.translate(
+            result = await self._translate_once(
                 subtask['text'],
                 subtask['source_lang'],
                 subtask['target_lang']
@@ -135,7 +160,7 @@ class TranslationROMA:
         subtasks: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """
-        Execute subtasks in parallel with concurrency control
+        Execute subtasks in parallel
         
         Args:
             subtasks: List of subtasks to execute
@@ -143,16 +168,9 @@ class TranslationROMA:
         Returns:
             List of results
         """
-        # Use semaphore for concurrency control
-        semaphore = asyncio.Semaphore(self.max_concurrent)
-        
-        async def execute_with_limit(subtask):
-            async with semaphore:
-                return await self.execute_subtask(subtask)
-        
-        # Execute all subtasks in parallel
+        # Execute all subtasks in parallel (provider limiters bound concurrency)
         results = await asyncio.gather(
-            *[execute_with_limit(subtask) for subtask in subtasks],
+            *[self.execute_subtask(subtask) for subtask in subtasks],
             return_exceptions=True
         )
         
@@ -172,6 +190,40 @@ class TranslationROMA:
         
         return processed_results
     
+    async def translate_as_completed(
+        self,
+        text: str,
+        source_lang: str,
+        target_languages: List[str]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming executor: yield subtask results in completion order
+        
+        Unlike execute_parallel, the first result is available as soon as the
+        fastest provider call finishes. Pending subtasks are cancelled if the
+        consumer stops iterating early.
+        
+        Args:
+            text: Source text
+            source_lang: Source language
+            target_languages: List of target languages
+        
+        Yields:
+            Subtask results (same shape as execute_subtask)
+        """
+        subtasks = await self.create_translation_plan(
+            text, source_lang, target_languages
+        )
+        tasks = [asyncio.ensure_future(self.execute_subtask(subtask)) for subtask in subtasks]
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
     async def aggregate_results(
         self,
         results: List[Dict[str, Any]]
@@ -215,7 +267,7 @@ class TranslationROMA:
         
         if not use_parallel:
             # Direct execution for single language or simple cases
-            result = await self.translation_service.translate(
+            result = await self._translate_once(
                 text, source_lang, target_languages[0]
             )
             return {
@@ -7,7 +7,7 @@ Main translation bot with ROMA integration
 import asyncio
 import time
 import uuid
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, AsyncIterator
 from .roma_integration import TranslationROMA
 from .config_loader import get_config_loader
 from ..services.translation_providers import MultiProviderTranslationService
@@ -18,6 +18,9 @@ from ..executors.translation import TranslationExecutor
 from ..executors.quality_check import QualityCheckExecutor
 from ..executors.format_preservation import FormatPreservationExecutor
 from ..utils.logger import get_logger
+from ..utils.single_flight import translation_flights
+from ..utils.thread_pools import get_executor_stats
+from ..utils.error_recovery import get_circuit_breaker_stats, get_retry_budget_stats
 
 logger = get_logger("translation_agent")
 
@@ -46,6 +49,15 @@ class TranslationBot:
         # Initialize ROMA integration
         self.roma = TranslationROMA(self.translation_service)
         
+        # Cache warm-up from translation memory after startup
+        warmup_config = self.config.get("cache", {}).get("warmup", {})
+        self.warmup_enabled = warmup_config.get("enabled", True) and self.translation_executor.use_memory
+        self.warmup_max_entries = int(warmup_config.get("max_entries", 20000))
+        self.warmup_half_life_days = float(warmup_config.get("half_life_days", 7))
+        self.warmup_budget_bytes = int(self.cache.max_bytes * float(warmup_config.get("budget_ratio", 0.5)))
+        self._warmup_task: Optional[asyncio.Task] = None
+        self.warmup_stats: Dict = {"status": "pending" if self.warmup_enabled else "disabled"}
+        
         # Database will be initialized on first use
     
     async def translate(
@@ -69,13 +81,87 @@ class TranslationBot:
         """
         start_time = time.time()
         
-        # Initialize database if needed
-        try:
-            await self.db.initialize()
-        except Exception:
-            pass  # Already initialized
+        source_language = await self._prepare(text, target_languages, source_language)
+        
+        # Resolve what we can from cache and translation memory first
+        translations = await self.translation_executor.resolve(
+            text, source_language, target_languages
+        )
+        cached_languages = {lang: lang in translations for lang in target_languages}
+        missing_languages = [lang for lang in target_languages if lang not in translations]
         
-        # Validate input - get fresh config values
+        if missing_languages:
+            fresh = await self._translate_missing(text, source_language, missing_languages)
+            translations.update(fresh)
+            await self.translation_executor.remember(text, source_language, fresh)
+        else:
+            logger.info(f"💾 All {len(target_languages)} translations served from cache")
+        
+        return await self._build_result(
+            text, source_language, target_languages, translations,
+            cached_languages, preserve_formatting, start_time
+        )
+    
+    async def _build_result(
+        self,
+        text: str,
+        source_language: str,
+        target_languages: List[str],
+        translations: Dict[str, str],
+        cached_languages: Dict[str, bool],
+        preserve_formatting: bool,
+        start_time: float
+    ) -> Dict:
+        """Format, score and persist translations and build the response dictionary"""
+        # Keep the requested language order
+        translations = {
+            lang: translations[lang]
+            for lang in target_languages
+            if lang in translations
+        }
+        
+        # Preserve formatting if requested
+        if preserve_formatting:
+            translations = await self.format_preserver.execute(text, translations)
+        
+        # Calculate quality scores
+        quality_scores = await self.quality_checker.execute(
+            text, translations, source_language
+        )
+        
+        # Queue translations for the background database writer
+        for lang, translation in translations.items():
+            quality = quality_scores.get(lang, 0.0)
+            await self.db.enqueue_translation(
+                text, source_language, lang, translation, quality
+            )
+        
+        missing_languages = [lang for lang, hit in cached_languages.items() if not hit]
+        processing_time = int((time.time() - start_time) * 1000)
+        
+        return {
+            "request_id": str(uuid.uuid4()),
+            "source_language": source_language,
+            "translations": translations,
+            "quality_scores": quality_scores,
+            "processing_time_ms": processing_time,
+            "cached": all(cached_languages.values()),
+            "cached_languages": cached_languages,
+            "metadata": {
+                "provider": "Multi-Provider (DeepL/Azure/LibreTranslate)",
+                "parallel_execution": len(missing_languages) > 1,
+                "cache_hits": sum(cached_languages.values()),
+                "roma_enabled": True
+            }
+        }
+    
+    def validate_request(self, text: str, target_languages: List[str]):
+        """
+        Validate request limits against fresh config values
+        
+        Raises:
+            ValueError: If the text or language list exceeds configured limits
+        """
         config = self.config_loader.get_config()
         
         max_length = config.get("translation", {}).get("max_text_length", 10000)
@@ -85,11 +171,283 @@ class TranslationBot:
         max_langs = config.get("translation", {}).get("max_target_languages", 10)
         if len(target_languages) > max_langs:
             raise ValueError(f"Too many target languages. Maximum: {max_langs}")
+    
+    async def _prepare(
+        self,
+        text: str,
+        target_languages: List[str],
+        source_language: Optional[str]
+    ) -> str:
+        """Initialize storage, validate input and resolve the source language"""
+        # Initialize database if needed
+        try:
+            await self.db.initialize()
+        except Exception:
+            pass  # Already initialized
+        
+        self.validate_request(text, target_languages)
         
         # Detect source language if not provided
         if not source_language:
             source_language = await self.lang_detector.execute(text)
         
+        return source_language
+    
+    async def translate_stream(
+        self,
+        text: str,
+        target_languages: List[str],
+        source_language: Optional[str] = None,
+        preserve_formatting: bool = True
+    ) -> AsyncIterator[Dict]:
+        """
+        Translate text and yield each language's result as soon as it is ready
+        
+        Cached languages are yielded first, then provider results in
+        completion order rather than waiting for the slowest provider.
+        
+        Args:
+            text: Text to translate
+            target_languages: List of target language codes
+            source_language: Source language code (auto-detected if None)
+            preserve_formatting: Whether to preserve formatting
+        
+        Yields:
+            One dictionary per target language with translation, quality score
+            and cache status (or an error if that language failed)
+        """
+        source_language = await self._prepare(text, target_languages, source_language)
+        
+        resolved = await self.translation_executor.resolve(
+            text, source_language, target_languages
+        )
+        
+        for lang in target_languages:
+            if lang in resolved:
+                yield await self._finish_language(
+                    text, source_language, lang, resolved[lang],
+                    preserve_formatting, cached=True
+                )
+        
+        missing_languages = [lang for lang in target_languages if lang not in resolved]
+        
+        async for result in self.roma.translate_as_completed(
+            text, source_language, missing_languages
+        ):
+            lang = result['target_lang']
+            
+            if not result['success']:
+                yield {
+                    "language": lang,
+                    "source_language": source_language,
+                    "success": False,
+                    "error": result['error']
+                }
+                continue
+            
+            await self.translation_executor.remember(
+                text, source_language, {lang: result['translation']}
+            )
+            item = await self._finish_language(
+                text, source_language, lang, result['translation'],
+                preserve_formatting, cached=False
+            )
+            item["provider"] = result['provider']
+            yield item
+    
+    def validate_batch(self, texts: List[str], target_languages: List[str]):
+        """
+        Validate batch limits against fresh config values
+        
+        Raises:
+            ValueError: If the batch exceeds configured limits
+        """
+        batch_config = self.config_loader.get_config().get("translation", {}).get("batch", {})
+        
+        max_texts = batch_config.get("max_texts", 100)
+        if len(texts) > max_texts:
+            raise ValueError(f"Too many texts in batch. Maximum: {max_texts}")
+        
+        max_characters = batch_config.get("max_total_characters", 100000)
+        if sum(len(text) for text in texts) > max_characters:
+            raise ValueError(f"Batch too large. Maximum: {max_characters} characters in total")
+        
+        for text in texts:
+            self.validate_request(text, target_languages)
+    
+    async def translate_batch(
+        self,
+        texts: List[str],
+        target_languages: List[str],
+        source_language: Optional[str] = None,
+        preserve_formatting: bool = True
+    ) -> List[Dict]:
+        """
+        Translate many texts to the same target languages
+        
+        Args:
+            texts: Texts to translate
+            target_languages: List of target language codes
+            source_language: Source language code (auto-detected per text if None)
+            preserve_formatting: Whether to preserve formatting
+        
+        Returns:
+            One result per input text, in input order
+        """
+        return [
+            result
+            async for result in self.translate_batch_iter(
+                texts, target_languages, source_language, preserve_formatting
+            )
+        ]
+    
+    async def translate_batch_iter(
+        self,
+        texts: List[str],
+        target_languages: List[str],
+        source_language: Optional[str] = None,
+        preserve_formatting: bool = True
+    ) -> AsyncIterator[Dict]:
+        """
+        Translate many texts and yield results in input order as they become ready
+        
+        Identical texts are translated once, language detection runs once per
+        unique text, and provider calls for the whole batch share one
+        concurrency limit.
+        
+        Args:
+            texts: Texts to translate
+            target_languages: List of target language codes
+            source_language: Source language code (auto-detected per text if None)
+            preserve_formatting: Whether to preserve formatting
+        
+        Yields:
+            Translation result dictionaries (same shape as translate) with an
+            added index, or an error entry for texts that failed
+        """
+        self.validate_batch(texts, target_languages)
+        
+        try:
+            await self.db.initialize()
+        except Exception:
+            pass  # Already initialized
+        
+        batch_config = self.config_loader.get_config().get("translation", {}).get("batch", {})
+        semaphore = asyncio.Semaphore(batch_config.get("max_concurrent", 10))
+        
+        # One task per unique text
+        tasks = {}
+        for text in texts:
+            if text not in tasks:
+                tasks[text] = asyncio.ensure_future(self._translate_batch_text(
+                    text, target_languages, source_language, preserve_formatting, semaphore
+                ))
+        
+        logger.info(f"📦 Batch: {len(texts)} texts ({len(tasks)} unique) → {len(target_languages)} languages")
+        
+        try:
+            for index, text in enumerate(texts):
+                try:
+                    result = await tasks[text]
+                    yield {"index": index, **result}
+                except Exception as e:
+                    yield {"index": index, "success": False, "error": str(e)}
+        finally:
+            for task in tasks.values():
+                if not task.done():
+                    task.cancel()
+    
+    async def _translate_batch_text(
+        self,
+        text: str,
+        target_languages: List[str],
+        source_language: Optional[str],
+        preserve_formatting: bool,
+        semaphore: asyncio.Semaphore
+    ) -> Dict:
+        """Translate one unique batch text, sharing the batch-wide provider limit"""
+        start_time = time.time()
+        
+        if not source_language:
+            source_language = await self.lang_detector.execute(text)
+        
+        translations = await self.translation_executor.resolve(
+            text, source_language, target_languages
+        )
+        cached_languages = {lang: lang in translations for lang in target_languages}
+        missing_languages = [lang for lang in target_languages if lang not in translations]
+        
+        if missing_languages:
+            subtasks = await self.roma.create_translation_plan(
+                text, source_language, missing_languages
+            )
+            
+            async def execute_with_limit(subtask):
+                async with semaphore:
+                    return await self.roma.execute_subtask(subtask)
+            
+            results = await asyncio.gather(
+                *[execute_with_limit(subtask) for subtask in subtasks]
+            )
+            fresh = await self.roma.aggregate_results(results)
+            translations.update(fresh)
+            await self.translation_executor.remember(text, source_language, fresh)
+        
+        return await self._build_result(
+            text, source_language, target_languages, translations,
+            cached_languages, preserve_formatting, start_time
+        )
+    
+    async def _finish_language(
+        self,
+        text: str,
+        source_language: str,
+        lang: str,
+        translation: str,
+        preserve_formatting: bool,
+        cached: bool
+    ) -> Dict:
+        """Apply formatting, score and persist a single streamed translation"""
+        translations = {lang: translation}
+        
+        if preserve_formatting:
+            translations = await self.format_preserver.execute(text, translations)
+        
+        quality_scores = await self.quality_checker.execute(
+            text, translations, source_language
+        )
+        quality = quality_scores.get(lang, 0.0)
+        
+        await self.db.enqueue_translation(
+            text, source_language, lang, translations[lang], quality
+        )
+        
+        return {
+            "language": lang,
+            "source_language": source_language,
+            "translation": translations[lang],
+            "quality_score": quality,
+            "cached": cached,
+            "success": True
+        }
+    
+    async def _translate_missing(
+        self,
+        text: str,
+        source_language: str,
+        target_languages: List[str]
+    ) -> Dict[str, str]:
+        """
+        Translate languages that were not resolved from cache via ROMA
+        
+        Args:
+            text: Text to translate
+            source_language: Source language
+            target_languages: Target languages missing from cache
+        
+        Returns:
+            Dictionary of translations
+        """
         # Use ROMA for intelligent parallel translation
         try:
             roma_result = await self.roma.translate(
@@ -98,51 +456,20 @@ class TranslationBot:
                 target_languages=target_languages
             )
             
-            translations = roma_result.get("translations", {})
             execution_mode = roma_result.get("execution_mode", "unknown")
             
             # Log ROMA execution mode
             if execution_mode == "parallel_roma":
                 logger.info(f"✨ ROMA parallel execution: {roma_result.get('successful_count')}/{len(target_languages)} translations")
+            
+            return roma_result.get("translations", {})
         
         except Exception as e:
             # Fallback to direct translation if ROMA fails
             logger.warning(f"⚠️  ROMA failed, using direct translation: {e}")
-            translations = await self._direct_translate(
+            return await self._direct_translate(
                 text, source_language, target_languages
             )
-        
-        # Preserve formatting if requested
-        if preserve_formatting:
-            translations = await self.format_preserver.execute(text, translations)
-        
-        # Calculate quality scores
-        quality_scores = await self.quality_checker.execute(
-            text, translations, source_language
-        )
-        
-        # Save translations to database
-        for lang, translation in translations.items():
-            quality = quality_scores.get(lang, 0.0)
-            await self.db.save_translation(
-                text, source_language, lang, translation, quality
-            )
-        
-        processing_time = int((time.time() - start_time) * 1000)
-        
-        return {
-            "request_id": str(uuid.uuid4()),
-            "source_language": source_language,
-            "translations": translations,
-            "quality_scores": quality_scores,
-            "processing_time_ms": processing_time,
-            "cached": self._check_if_cached(text, source_language, target_languages),
-            "metadata": {
-                "provider": "Multi-Provider (DeepL/Azure/LibreTranslate)",
-                "parallel_execution": len(target_languages) > 1,
-                "roma_enabled": True
-            }
-        }
     
     async def _direct_translate(
         self,
@@ -161,9 +488,9 @@ class TranslationBot:
         Returns:
             Dictionary of translations
         """
-        # Parallel translation
+        # Parallel translation (cache was already consulted by the caller)
         tasks = [
-            self.translation_executor.execute(text, source_language, lang)
+            self.translation_executor.execute(text, source_language, lang, use_cache=False)
             for lang in target_languages
         ]
         
@@ -178,23 +505,74 @@ class TranslationBot:
         """Detect language of text"""
         return await self.lang_detector.execute(text)
     
-    def _check_if_cached(
-        self,
-        text: str,
-        source_lang: str,
-        target_languages: List[str]
-    ) -> bool:
-        """Check if translation is cached"""
-        for lang in target_languages:
-            if self.cache.get(text, source_lang, lang):
-                return True
-        return False
-    
     def get_stats(self) -> Dict:
         """Get bot statistics"""
         return {
             "cache": self.cache.get_stats(),
             "translation_service": self.translation_service.get_stats(),
-            "database": "connected" if self.db else "not connected"
+            "negative_cache": self.translation_service.negative_cache.get_stats(),
+            "hedging": self.translation_service.hedging.get_stats(),
+            "routing": self.translation_service.router.get_stats(),
+            "quota": self.translation_service.get_quota_stats(),
+            "circuit_breakers": get_circuit_breaker_stats(),
+            "retry_budgets": get_retry_budget_stats(),
+            "concurrency": {
+                name: limiter.get_stats() for name, limiter in self.translation_service.limiters.items()
+            },
+            "char_rate": {
+                name: bucket.get_stats() for name, bucket in self.translation_service.char_buckets.items()
+            },
+            "provider_clients": self.translation_service.clients.get_stats(),
+            "single_flight": translation_flights.get_stats(),
+            "executors": get_executor_stats(),
+            "warmup": self.warmup_stats,
+            "database": {
+                "status": "connected" if self.db else "not connected",
+                **self.db.get_stats()
+            }
         }
+    
+    async def start(self):
+        """Start background work (cache sweeper, warm restore and warm-up) at process startup"""
+        self.cache.start()
+        await self.translation_service.start()
+        
+        if self.warmup_enabled and self._warmup_task is None:
+            self._warmup_task = asyncio.create_task(self._warm_up())
+    
+    async def _warm_up(self):
+        """Preload the cache from high-usage translation memory rows"""
+        self.warmup_stats = {"status": "running"}
+        try:
+            await self.db.initialize()
+            result = await self.translation_executor.warm_cache(
+                self.warmup_max_entries,
+                self.warmup_half_life_days,
+                self.warmup_budget_bytes
+            )
+        except Exception as e:
+            logger.warning(f"⚠️  Cache warm-up failed: {e}")
+            self.warmup_stats = {"status": "failed", "error": str(e)}
+            return
+        
+        self.warmup_stats = {"status": "done", **result}
+        logger.info(
+            f"🔥 Warmed cache with {result['entries']} translations from memory "
+            f"in {result['duration_ms']:.0f}ms"
+        )
+    
+    async def shutdown(self):
+        """Snapshot the cache and close the disk tier, then flush pending database writes"""
+        if self._warmup_task is not None and not self._warmup_task.done():
+            self._warmup_task.cancel()
+            try:
+                await self._warmup_task
+            except asyncio.CancelledError:
+                pass
+        
+        # Cache first: closing it cancels SWR refreshes that would otherwise
+        # write to the translation memory after the database is closed
+        await self.cache.close()
+        await self.db.close()
+        await self.translation_service.aclose()
 
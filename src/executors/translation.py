@@ -4,11 +4,19 @@ Translation Executor
 Core translation logic using LLM service
 """
 
-from typing import Optional
+import asyncio
+import time
+from contextlib import aclosing
+from typing import Any, Optional, Dict, List
 from .base import BaseExecutor
+from ..core.config_loader import get_config_loader
 from ..services.translation_providers import MultiProviderTranslationService
 from ..services.cache_service import SimpleCacheService
 from ..services.database_service import DatabaseService
+from ..utils.logger import get_logger
+from ..utils.single_flight import translation_flights
+
+logger = get_logger("translation_executor")
 
 
 class TranslationExecutor(BaseExecutor):
@@ -23,6 +31,134 @@ class TranslationExecutor(BaseExecutor):
         self.translation_service = translation_service
         self.cache = cache_service
         self.db = db_service
+        
+        translation_config = get_config_loader().get_config().get("translation", {})
+        self.use_memory = translation_config.get("enable_translation_memory", True)
+        
+        # Stale cache entries are served immediately and re-translated in the background
+        self.cache.set_refresher(self.refresh)
+    
+    async def resolve(
+        self,
+        text: str,
+        source_lang: str,
+        target_languages: List[str]
+    ) -> Dict[str, str]:
+        """
+        Resolve translations from cache and translation memory only
+        
+        Languages found in translation memory are promoted into the cache.
+        No provider calls are made.
+        
+        Args:
+            text: Text to translate
+            source_lang: Source language code
+            target_languages: Target language codes
+        
+        Returns:
+            Dictionary of {language: translation} for the languages that were found
+        """
+        resolved = {}
+        
+        for target_lang in target_languages:
+            cached = self.cache.get(text, source_lang, target_lang)
+            if cached:
+                resolved[target_lang] = cached
+        
+        if not self.use_memory:
+            return resolved
+        
+        missing = [lang for lang in target_languages if lang not in resolved]
+        if not missing:
+            return resolved
+        
+        try:
+            memory = await self.db.get_from_memory_many(text, source_lang, missing)
+        except Exception as e:
+            logger.warning(f"⚠️  Translation memory lookup failed: {e}")
+            return resolved
+        
+        for target_lang, translation in memory.items():
+            self.cache.set(text, source_lang, target_lang, translation)
+            resolved[target_lang] = translation
+        
+        return resolved
+    
+    async def remember(
+        self,
+        text: str,
+        source_lang: str,
+        translations: Dict[str, str]
+    ):
+        """
+        Write fresh provider translations back to cache and translation memory
+        
+        Args:
+            text: Source text
+            source_lang: Source language code
+            translations: Dictionary of {language: translation}
+        """
+        for target_lang, translation in translations.items():
+            self.cache.set(text, source_lang, target_lang, translation)
+        
+        if not self.use_memory:
+            return
+        
+        try:
+            await self.db.save_to_memory_many(text, source_lang, translations)
+        except Exception as e:
+            logger.warning(f"⚠️  Could not save to translation memory: {e}")
+    
+    async def refresh(self, text: str, source_lang: str, target_lang: str):
+        """Re-translate a stale cache entry and store the fresh result"""
+        # Shares the in-flight call if a foreground request is translating the same text
+        result = await translation_flights.do(
+            ("translate", text, source_lang, target_lang),
+            self.translation_service.translate,
+            text,
+            source_lang,
+            target_lang
+        )
+        await self.remember(text, source_lang, {target_lang: result['translation']})
+    
+    async def warm_cache(
+        self,
+        max_entries: int,
+        half_life_days: float,
+        budget_bytes: int
+    ) -> Dict[str, Any]:
+        """
+        Preload the cache from the most valuable translation memory rows
+        
+        Args:
+            max_entries: Maximum number of rows to load
+            half_life_days: Recency weighting for usage counts
+            budget_bytes: Stop once the cache holds this many bytes
+        
+        Returns:
+            Dictionary with the number of entries warmed and the duration
+        """
+        start = time.perf_counter()
+        warmed = 0
+        
+        async with aclosing(self.db.iter_top_memory(max_entries, half_life_days)) as batches:
+            async for rows in batches:
+                for source_text, source_lang, target_lang, translation in rows:
+                    if self.cache.total_bytes >= budget_bytes:
+                        break
+                    if self.cache.preload(source_text, source_lang, target_lang, translation):
+                        warmed += 1
+                
+                if self.cache.total_bytes >= budget_bytes:
+                    break
+                
+                # Let requests run between batches
+                await asyncio.sleep(0)
+        
+        return {
+            "entries": warmed,
+            "duration_ms": (time.perf_counter() - start) * 1000
+        }
     
     async def execute(
         self,
@@ -43,18 +179,11 @@ class TranslationExecutor(BaseExecutor):
         Returns:
             Translated text
         """
-        # Check cache first
+        # Check cache and translation memory first
         if use_cache:
-            cached = self.cache.get(text, source_lang, target_lang)
-            if cached:
-                return cached
-            
-            # Check translation memory
-            memory = await self.db.get_from_memory(text, source_lang, target_lang)
-            if memory:
-                # Update cache
-                self.cache.set(text, source_lang, target_lang, memory)
-                return memory
+            resolved = await self.resolve(text, source_lang, [target_lang])
+            if target_lang in resolved:
+                return resolved[target_lang]
         
         # Translate with multi-provider service
         result = await self.translation_service.translate(text, source_lang, target_lang)
@@ -62,8 +191,6 @@ class TranslationExecutor(BaseExecutor):
         
         # Cache and save
         if use_cache:
-            self.cache.set(text, source_lang, target_lang, translation)
-            await self.db.save_to_memory(text, source_lang, target_lang, translation)
+            await self.remember(text, source_lang, {target_lang: translation})
         
         return translation
-
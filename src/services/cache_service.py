@@ -2,41 +2,342 @@
 Cache Service
 
 In-memory cache for translations
+
+Bounded by entry count and bytes, with W-TinyLFU eviction: new entries land
+in a small LRU window and must beat the coldest main-cache entry on access
+frequency to be admitted, so one-off texts don't push out hot phrases.
+
+Misses fall through to an optional shared on-disk tier (see disk_cache.py);
+hits there are promoted into memory. Expired entries are dropped by a
+background sweeper driven by a time-bucketed expiry wheel, and the hottest
+entries are snapshotted to disk so restarts come back warm.
 """
 
-from typing import Optional, Dict
+from typing import Awaitable, Callable, Optional, Dict, List, Set, Union, Any
+from collections import OrderedDict
+import asyncio
 import hashlib
+import heapq
+import sys
 import time
 import os
+import zlib
+from .cache_snapshot import SnapshotRecord, read_snapshot, write_snapshot
+from .disk_cache import DiskCacheTier
 from ..core.config_loader import get_config_loader
 from ..utils.logger import get_logger
+from ..utils.rate_limit import TokenBucket
+from ..utils.validators import language_pair
 
 logger = get_logger("cache_service")
 
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional dependency
+    xxhash = None
+
+# Per-entry bookkeeping overhead (ordered dict node, slotted entry, 16-byte key,
+# expiry wheel slot) added to the value size for byte accounting
+ENTRY_OVERHEAD_BYTES = 240
+
+
+class _Entry:
+    """Cached translation with its metadata"""
+    
+    # value is a str, or zlib-compressed UTF-8 bytes for large translations.
+    # stored_at is shared between entries written in the same second and the
+    # size is derived from the value, so no per-entry number objects are kept.
+    __slots__ = ("value", "stored_at", "pair")
+    
+    def __init__(self, value: Union[str, bytes], stored_at: float, pair: str):
+        self.value = value
+        self.stored_at = stored_at
+        self.pair = pair
+    
+    @property
+    def size(self) -> int:
+        return sys.getsizeof(self.value) + ENTRY_OVERHEAD_BYTES
+    
+    def translation(self) -> str:
+        value = self.value
+        if value.__class__ is bytes:
+            return zlib.decompress(value).decode("utf-8")
+        return value
+
+# Lookup table that halves every 4-bit counter in one bytes.translate() call
+_HALVE = bytes(i >> 1 for i in range(256))
+
+
+class FrequencySketch:
+    """
+    Count-min sketch with 4-bit saturating counters and periodic aging
+    
+    Estimates how often a key was seen recently in constant time and space.
+    Counters are halved after a sample period so old popularity fades.
+    """
+    
+    _SEEDS = (
+        0x9E3779B97F4A7C15,
+        0xC2B2AE3D27D4EB4F,
+        0x165667B19E3779F9,
+        0xD6E8FEB86659FD93,
+    )
+    _MASK64 = 0xFFFFFFFFFFFFFFFF
+    
+    def __init__(self, capacity: int):
+        width = 16
+        while width < capacity:
+            width <<= 1
+        
+        self._width = width
+        self._shift = 64 - width.bit_length() + 1
+        self._table = bytearray(width * len(self._SEEDS))
+        self._sample_size = 10 * width
+        self._additions = 0
+    
+    def _indexes(self, key: bytes):
+        # Keys are already uniform digests, so their leading bytes serve as the hash
+        h = int.from_bytes(key[:8], "little")
+        for row, seed in enumerate(self._SEEDS):
+            yield row * self._width + (((h * seed) & self._MASK64) >> self._shift)
+    
+    def increment(self, key: bytes):
+        """Record one access of key"""
+        table = self._table
+        for index in self._indexes(key):
+            if table[index] < 15:
+                table[index] += 1
+        
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._table = bytearray(self._table.translate(_HALVE))
+            self._additions //= 2
+    
+    def frequency(self, key: bytes) -> int:
+        """Estimated recent access count of key"""
+        table = self._table
+        return min(table[index] for index in self._indexes(key))
+
+
+class _PairStats:
+    """Incrementally maintained cache counters for one language pair"""
+    
+    __slots__ = ("hits", "misses", "expirations", "evictions", "entries", "bytes")
+    
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.entries = 0
+        self.bytes = 0
+    
+    def as_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups > 0 else 0,
+            "expirations": self.expirations,
+            "evictions": self.evictions,
+            "entries": self.entries,
+            "bytes": self.bytes
+        }
+
 
 class SimpleCacheService:
     """FREE in-memory cache - no Redis needed!"""
     
-    def __init__(self, ttl: Optional[int] = None):
+    def __init__(
+        self,
+        ttl: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        use_l2: bool = True
+    ):
         self.config_loader = get_config_loader()
         cache_config = self.config_loader.get_config().get("cache", {})
         
-        self.cache: Dict[str, tuple] = {}  # key: (value, timestamp)
         self.ttl = ttl or int(os.getenv("CACHE_TTL", cache_config.get("ttl", 86400)))
         self.enabled = os.getenv("CACHE_ENABLED", "true").lower() == "true"
         
+        # Size limits
+        self.max_entries = max(2, max_entries or int(cache_config.get("max_entries", 100000)))
+        self.max_bytes = max_bytes or int(cache_config.get("max_bytes", 64 * 1024 * 1024))
+        
+        # W-TinyLFU regions: ~1% LRU window, main split into probation (20%) and protected (80%)
+        window_ratio = float(cache_config.get("window_ratio", 0.01))
+        self.window_capacity = max(1, int(self.max_entries * window_ratio))
+        self.main_capacity = max(1, self.max_entries - self.window_capacity)
+        self.protected_capacity = max(1, int(self.main_capacity * 0.8))
+        
+        # Large values are stored zlib-compressed when that saves space
+        compression_config = cache_config.get("compression", {})
+        self.compress_threshold = int(compression_config.get("threshold_bytes", 512))
+        self.compress_level = int(compression_config.get("level", 6))
+        self.compressed_entries = 0
+        
+        # key: 16-byte digest of (text, source, target)
+        self._window: "OrderedDict[bytes, _Entry]" = OrderedDict()
+        self._probation: "OrderedDict[bytes, _Entry]" = OrderedDict()
+        self._protected: "OrderedDict[bytes, _Entry]" = OrderedDict()
+        self._sketch = FrequencySketch(self.max_entries)
+        
+        # Expiry wheel: bucket number -> keys expiring in that bucket
+        sweeper_config = cache_config.get("sweeper", {})
+        self.expiry_resolution = max(1, int(sweeper_config.get("resolution_seconds", 60)))
+        self.sweep_interval = float(sweeper_config.get("interval_seconds", 60))
+        self.sweep_batch_size = max(1, int(sweeper_config.get("batch_size", 500)))
+        self._wheel: Dict[int, Set[bytes]] = {}
+        self._clock = 0.0
+        self._wheel_buckets: List[int] = []
+        # Buckets currently on the heap (a bucket emptied and refilled is pushed once)
+        self._wheel_scheduled: Set[int] = set()
+        self._sweeper_task: Optional[asyncio.Task] = None
+        
+        # Stale-while-revalidate: past the TTL, entries are served for a grace
+        # window while one rate-limited background refresh per key runs
+        swr_config = cache_config.get("swr", {})
+        self.stale_grace = int(swr_config.get("grace_seconds", 3600)) if swr_config.get("enabled", False) else 0
+        self._max_age = self.ttl + self.stale_grace
+        self._refresher: Optional[Callable[[str, str, str], Awaitable[Any]]] = None
+        self._refresh_limiter = TokenBucket(
+            float(swr_config.get("refresh_rate", 2)),
+            float(swr_config.get("refresh_burst", 10))
+        )
+        self._refreshing: Set[bytes] = set()
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        self.stale_hits = 0
+        self.refreshes = 0
+        self.refreshes_deduplicated = 0
+        self.refreshes_throttled = 0
+        self.refresh_failures = 0
+        
+        # Warm restarts: snapshot of the hottest entries, restored in the background at boot
+        snapshot_config = cache_config.get("snapshot", {})
+        self.snapshot_enabled = bool(snapshot_config.get("enabled", False))
+        self.snapshot_path = snapshot_config.get("path", "data/cache_snapshot.bin")
+        self.snapshot_interval = float(snapshot_config.get("interval_seconds", 300))
+        self.snapshot_max_entries = int(snapshot_config.get("max_entries", 50000))
+        self._snapshot_task: Optional[asyncio.Task] = None
+        self._snapshot_restored = False
+        self.snapshots_saved = 0
+        self.snapshot_restored_entries = 0
+        
+        # Counters (kept incrementally so get_stats is constant time)
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.rejections = 0
+        self.sweeps = 0
+        self._pairs: Dict[str, _PairStats] = {}
+        
+        # Shared L2 tier on disk (None when disabled or unavailable)
+        self.l2 = DiskCacheTier.from_config(cache_config) if self.enabled and use_l2 else None
+        
         if self.enabled:
-            logger.info("✅ Using in-memory cache (FREE!)")
+            logger.info(
+                f"✅ Using in-memory cache (FREE!) - max {self.max_entries} entries, "
+                f"{self.max_bytes // (1024 * 1024)}MB"
+            )
     
     def _make_key(
         self,
         text: str,
         source_lang: str,
         target_lang: str
-    ) -> str:
-        """Create cache key"""
-        content = f"{text}:{source_lang}:{target_lang}"
-        return hashlib.md5(content.encode()).hexdigest()
+    ) -> bytes:
+        """Create a 16-byte cache key (stable across processes, shared with the disk tier)"""
+        hasher = xxhash.xxh3_128() if xxhash is not None else hashlib.blake2b(digest_size=16)
+        hasher.update(text.encode("utf-8"))
+        hasher.update(f"\0{source_lang}\0{target_lang}".encode())
+        return hasher.digest()
+    
+    def _now(self) -> float:
+        """Current time truncated to the second (one shared float per second)"""
+        current = time.time()
+        if current - self._clock >= 1.0:
+            self._clock = float(int(current))
+        return self._clock
+    
+    def _encode(self, translation: str) -> Union[str, bytes]:
+        """Compress large values when it saves space"""
+        if len(translation) < self.compress_threshold:
+            return translation
+        
+        raw = translation.encode("utf-8")
+        compressed = zlib.compress(raw, self.compress_level)
+        if len(compressed) < len(raw):
+            return compressed
+        return translation
+    
+    def _pair_stats(self, pair: str) -> _PairStats:
+        """Get counters for a language pair"""
+        stats = self._pairs.get(pair)
+        if stats is None:
+            stats = self._pairs[pair] = _PairStats()
+        return stats
+    
+    def _bucket_of(self, timestamp: float) -> int:
+        """Expiry wheel bucket for an entry stored at timestamp"""
+        return int((timestamp + self._max_age) // self.expiry_resolution)
+    
+    def _schedule_expiry(self, key: bytes, timestamp: float):
+        """Add key to its expiry bucket"""
+        bucket = self._bucket_of(timestamp)
+        keys = self._wheel.get(bucket)
+        if keys is None:
+            keys = self._wheel[bucket] = set()
+            if bucket not in self._wheel_scheduled:
+                self._wheel_scheduled.add(bucket)
+                heapq.heappush(self._wheel_buckets, bucket)
+        keys.add(key)
+    
+    def _unschedule_expiry(self, key: bytes, timestamp: float):
+        """Remove key from its expiry bucket"""
+        bucket = self._bucket_of(timestamp)
+        keys = self._wheel.get(bucket)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._wheel[bucket]
+    
+    def _remove(self, region: OrderedDict, key: bytes, expired: bool = False) -> _Entry:
+        """Drop an entry and update counters"""
+        entry = region.pop(key)
+        self._discard(key, entry, expired)
+        return entry
+    
+    def _discard(self, key: bytes, entry: _Entry, expired: bool = False, rejected: bool = False):
+        """Update counters for an entry that left the cache (a rejection is not an eviction)"""
+        self._unschedule_expiry(key, entry.stored_at)
+        self.total_bytes -= entry.size
+        if entry.value.__class__ is bytes:
+            self.compressed_entries -= 1
+        
+        stats = self._pair_stats(entry.pair)
+        stats.entries -= 1
+        stats.bytes -= entry.size
+        if expired:
+            self.expirations += 1
+            stats.expirations += 1
+        elif rejected:
+            self.rejections += 1
+        else:
+            self.evictions += 1
+            stats.evictions += 1
+    
+    def _region_of(self, key: bytes) -> Optional[OrderedDict]:
+        """Find which region holds key"""
+        if key in self._protected:
+            return self._protected
+        if key in self._probation:
+            return self._probation
+        if key in self._window:
+            return self._window
+        return None
     
     def get(
         self,
@@ -49,18 +350,120 @@ class SimpleCacheService:
             return None
         
         key = self._make_key(text, source_lang, target_lang)
+        pair = language_pair(source_lang, target_lang)
+        self._sketch.increment(key)
         
-        if key in self.cache:
-            value, timestamp = self.cache[key]
+        region = self._region_of(key)
+        if region is not None:
+            entry = region[key]
+            age = time.time() - entry.stored_at
+            
+            # Check if expired (stale entries are still served during the grace window)
+            if age < self._max_age:
+                if age >= self.ttl:
+                    self.stale_hits += 1
+                    self._schedule_refresh(key, text, source_lang, target_lang)
+                
+                self._on_hit(key, region)
+                self.hits += 1
+                self._pair_stats(pair).hits += 1
+                return entry.translation()
             
-            # Check if expired
-            if time.time() - timestamp < self.ttl:
-                return value
-            else:
-                # Expired, remove
-                del self.cache[key]
+            self._remove(region, key, expired=True)
         
-        return None
+        value = self._get_from_l2(key, pair, text, source_lang, target_lang)
+        if value is None:
+            self.misses += 1
+            self._pair_stats(pair).misses += 1
+        else:
+            self.hits += 1
+            self._pair_stats(pair).hits += 1
+        return value
+    
+    def set_refresher(self, refresher: Callable[[str, str, str], Awaitable[Any]]):
+        """
+        Register the coroutine that re-translates stale entries
+        
+        It is called as refresher(text, source_lang, target_lang) and is
+        expected to write the fresh translation back with set().
+        """
+        self._refresher = refresher
+    
+    def _schedule_refresh(self, key: bytes, text: str, source_lang: str, target_lang: str):
+        """Start one background refresh per stale key, within the refresh rate"""
+        if self._refresher is None:
+            return
+        
+        if key in self._refreshing:
+            self.refreshes_deduplicated += 1
+            return
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        
+        # Entries stored together go stale together; don't stampede the providers
+        if not self._refresh_limiter.try_acquire():
+            self.refreshes_throttled += 1
+            return
+        
+        self._refreshing.add(key)
+        task = loop.create_task(self._refresh(key, text, source_lang, target_lang))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+    
+    async def _refresh(self, key: bytes, text: str, source_lang: str, target_lang: str):
+        """Run the refresher for a stale entry"""
+        try:
+            await self._refresher(text, source_lang, target_lang)
+            self.refreshes += 1
+        except Exception as e:
+            self.refresh_failures += 1
+            logger.debug(f"Stale cache refresh failed ({source_lang}->{target_lang}): {e}")
+        finally:
+            self._refreshing.discard(key)
+    
+    def _get_from_l2(
+        self,
+        key: bytes,
+        pair: str,
+        text: str,
+        source_lang: str,
+        target_lang: str
+    ) -> Optional[str]:
+        """Look up the shared disk tier and promote hits into memory"""
+        if self.l2 is None:
+            return None
+        
+        found = self.l2.get(key)
+        if found is None:
+            return None
+        
+        # Freshness on disk is governed by the L2 ttl (diskcache drops older
+        # entries); ones past L1's ttl come back as stale and get refreshed
+        value, stored_at = found
+        now = time.time()
+        if now - stored_at >= self.ttl:
+            stored_at = now - self.ttl
+            self._store(key, value, pair, stored_at)
+            self.stale_hits += 1
+            self._schedule_refresh(key, text, source_lang, target_lang)
+        else:
+            self._store(key, value, pair, stored_at)
+        return value
+    
+    def _on_hit(self, key: bytes, region: OrderedDict):
+        """Update recency, promoting probation entries to protected"""
+        if region is self._probation:
+            self._protected[key] = self._probation.pop(key)
+            
+            # Protected overflow falls back to probation as most recent
+            if len(self._protected) > self.protected_capacity:
+                demoted_key, demoted = self._protected.popitem(last=False)
+                self._probation[demoted_key] = demoted
+        else:
+            region.move_to_end(key)
     
     def set(
         self,
@@ -74,43 +477,425 @@ class SimpleCacheService:
             return
         
         key = self._make_key(text, source_lang, target_lang)
-        self.cache[key] = (translation, time.time())
+        self._store(key, translation, language_pair(source_lang, target_lang))
+        
+        if self.l2 is not None:
+            self.l2.set(key, translation)
+    
+    def _store(self, key: bytes, translation: str, pair: str, stored_at: Optional[float] = None):
+        """Insert or update an entry in the in-memory tier (stored_at defaults to now)"""
+        value = self._encode(translation)
+        size = sys.getsizeof(value) + ENTRY_OVERHEAD_BYTES
+        
+        if size > self.max_bytes:
+            self.rejections += 1
+            return
+        
+        self.start()
+        now = self._now() if stored_at is None else stored_at
+        stats = self._pair_stats(pair)
+        
+        if value.__class__ is bytes:
+            self.compressed_entries += 1
+        
+        region = self._region_of(key)
+        if region is not None:
+            # Update in place
+            entry = region[key]
+            old_size = entry.size
+            self._unschedule_expiry(key, entry.stored_at)
+            if entry.value.__class__ is bytes:
+                self.compressed_entries -= 1
+            self.total_bytes += size - old_size
+            stats.bytes += size - old_size
+            entry.value, entry.stored_at = value, now
+            self._on_hit(key, region)
+        else:
+            self._sketch.increment(key)
+            self._window[key] = _Entry(value, now, pair)
+            self.total_bytes += size
+            stats.entries += 1
+            stats.bytes += size
+        
+        self._schedule_expiry(key, now)
+        self._evict()
+    
+    def _evict(self):
+        """Move window overflow into main (if admitted) and enforce size limits"""
+        while len(self._window) > self.window_capacity:
+            candidate_key, candidate = self._window.popitem(last=False)
+            
+            if len(self._probation) + len(self._protected) < self.main_capacity:
+                self._probation[candidate_key] = candidate
+                continue
+            
+            self._admit(candidate_key, candidate)
+        
+        while self.total_bytes > self.max_bytes and self._evict_one_for_bytes():
+            pass
+    
+    def _admit(self, candidate_key: bytes, candidate: _Entry):
+        """TinyLFU admission: candidate replaces the probation victim only if it is more popular"""
+        victims = self._probation if self._probation else self._protected
+        victim_key = next(iter(victims))
+        
+        if self._sketch.frequency(candidate_key) > self._sketch.frequency(victim_key):
+            self._remove(victims, victim_key)
+            self._probation[candidate_key] = candidate
+        else:
+            self._discard(candidate_key, candidate, rejected=True)
+    
+    def _evict_one_for_bytes(self) -> bool:
+        """Evict the coldest entry to get back under the byte limit"""
+        for region in (self._probation, self._window, self._protected):
+            if region:
+                self._remove(region, next(iter(region)))
+                return True
+        return False
+    
+    def start(self):
+        """
+        Start background tasks (expiry sweeper, snapshot restore and periodic snapshots)
+        
+        Called from the process startup hooks, and lazily on first write inside
+        an event loop. Idempotent.
+        """
+        if self._sweeper_task is not None and not self._sweeper_task.done():
+            return
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Synchronous use (scripts); entries still expire lazily on read
+        
+        self._sweeper_task = asyncio.create_task(self._sweeper_loop())
+        if self.snapshot_enabled and self.enabled:
+            self._snapshot_task = asyncio.create_task(self._snapshot_loop())
+    
+    async def _sweeper_loop(self):
+        """Periodically expire entries from due wheel buckets"""
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.error(f"Cache sweep failed: {e}")
+    
+    async def sweep(self) -> int:
+        """
+        Expire entries whose wheel bucket has fully elapsed
+        
+        Works in slices of sweep_batch_size keys, yielding to the event loop
+        between slices so a large expiry wave never stalls request handling.
+        
+        Returns:
+            Number of entries expired
+        """
+        now = time.time()
+        due_bucket = int(now // self.expiry_resolution)
+        expired = 0
+        
+        while self._wheel_buckets and self._wheel_buckets[0] < due_bucket:
+            bucket = heapq.heappop(self._wheel_buckets)
+            self._wheel_scheduled.discard(bucket)
+            keys = list(self._wheel.pop(bucket, ()))
+            
+            for i, key in enumerate(keys):
+                if i and i % self.sweep_batch_size == 0:
+                    await asyncio.sleep(0)
+                    now = time.time()
+                
+                region = self._region_of(key)
+                # The entry may have been refreshed or evicted while we yielded
+                if region is not None and now - region[key].stored_at >= self._max_age:
+                    self._remove(region, key, expired=True)
+                    expired += 1
+        
+        self.sweeps += 1
+        if expired:
+            logger.debug(f"🧹 Swept {expired} expired cache entries")
+        return expired
     
     def clear_expired(self):
-        """Periodically clear expired entries"""
+        """Expire all due entries synchronously"""
         if not self.enabled:
             return
         
         current_time = time.time()
-        expired_keys = [
-            k for k, (v, t) in self.cache.items()
-            if current_time - t >= self.ttl
+        expired = [
+            (region, key)
+            for region in (self._window, self._probation, self._protected)
+            for key, entry in region.items()
+            if current_time - entry.stored_at >= self._max_age
         ]
         
-        for key in expired_keys:
-            del self.cache[key]
+        for region, key in expired:
+            self._remove(region, key, expired=True)
         
-        if expired_keys:
-            logger.info(f"🧹 Cleared {len(expired_keys)} expired cache entries")
+        if expired:
+            logger.info(f"🧹 Cleared {len(expired)} expired cache entries")
     
     def clear_all(self):
         """Clear all cache entries"""
-        self.cache.clear()
+        self._window.clear()
+        self._probation.clear()
+        self._protected.clear()
+        self._wheel.clear()
+        self._wheel_buckets.clear()
+        self._wheel_scheduled.clear()
+        self.total_bytes = 0
+        self.compressed_entries = 0
+        for stats in self._pairs.values():
+            stats.entries = 0
+            stats.bytes = 0
         logger.info("🧹 Cleared all cache entries")
     
-    def get_stats(self) -> dict:
-        """Get cache statistics"""
-        current_time = time.time()
-        active_entries = sum(
-            1 for _, (_, t) in self.cache.items()
-            if current_time - t < self.ttl
+    async def _snapshot_loop(self):
+        """Restore the last snapshot, then snapshot periodically"""
+        try:
+            await self.restore_snapshot()
+        except Exception as e:
+            logger.warning(f"⚠️  Could not restore cache snapshot: {e}")
+        self._snapshot_restored = True
+        
+        while True:
+            await asyncio.sleep(self.snapshot_interval)
+            try:
+                await self.save_snapshot()
+            except Exception as e:
+                logger.error(f"Cache snapshot failed: {e}")
+    
+    async def _snapshot_records(self) -> List[SnapshotRecord]:
+        """
+        Collect the hottest unexpired entries, most frequently used first
+        
+        Only the copy of the entries happens on the event loop; ranking them
+        by sketch frequency runs in a worker thread.
+        """
+        # Separate key and value lists copy faster than items() tuples
+        regions = [
+            (list(region), list(region.values()))
+            for region in (self._protected, self._probation, self._window)
+        ]
+        return await asyncio.to_thread(self._rank_snapshot_records, regions)
+    
+    def _rank_snapshot_records(self, regions: List[tuple]) -> List[SnapshotRecord]:
+        """Pick the snapshot_max_entries most frequent unexpired entries (runs off the event loop)"""
+        now = time.time()
+        frequency = self._sketch.frequency
+        hottest = heapq.nlargest(
+            self.snapshot_max_entries,
+            (
+                (key, entry)
+                for keys, entries in regions
+                for key, entry in zip(keys, entries)
+                if now - entry.stored_at < self.ttl
+            ),
+            key=lambda item: frequency(item[0])
         )
         
+        return [
+            SnapshotRecord(key, entry.value, entry.stored_at, self.ttl, entry.pair)
+            for key, entry in hottest
+        ]
+    
+    async def save_snapshot(self) -> int:
+        """
+        Write the hottest entries to the snapshot file
+        
+        Returns:
+            Number of entries written
+        """
+        start = time.perf_counter()
+        records = await self._snapshot_records()
+        count = await asyncio.to_thread(write_snapshot, self.snapshot_path, records)
+        
+        self.snapshots_saved += 1
+        logger.info(
+            f"💾 Saved cache snapshot: {count} entries in "
+            f"{(time.perf_counter() - start) * 1000:.0f}ms"
+        )
+        return count
+    
+    async def restore_snapshot(self) -> int:
+        """
+        Load the snapshot file into the cache in the background
+        
+        Entries are inserted hottest first in slices of sweep_batch_size,
+        yielding to the event loop between slices, so the hottest ones win
+        when the snapshot is larger than the cache. Keys written since boot
+        are left alone.
+        
+        Returns:
+            Number of entries restored
+        """
+        start = time.perf_counter()
+        records = await asyncio.to_thread(read_snapshot, self.snapshot_path)
+        restored_keys = []
+        
+        for i, record in enumerate(records):
+            if i and i % self.sweep_batch_size == 0:
+                await asyncio.sleep(0)
+            
+            if len(self._probation) + len(self._protected) >= self.main_capacity:
+                break
+            if self._restore_entry(record):
+                restored_keys.append(record.key)
+        
+        # Re-append coldest first so the hottest entries end up most recently used
+        for i, key in enumerate(reversed(restored_keys)):
+            if i and i % self.sweep_batch_size == 0:
+                await asyncio.sleep(0)
+            if key in self._probation:
+                self._probation.move_to_end(key)
+        
+        restored = len(restored_keys)
+        self.snapshot_restored_entries = restored
+        if records:
+            logger.info(
+                f"♻️  Restored {restored} cached translations from snapshot in "
+                f"{(time.perf_counter() - start) * 1000:.0f}ms"
+            )
+        return restored
+    
+    def _restore_entry(self, record: SnapshotRecord) -> bool:
+        """Insert a snapshot entry into the main region, preserving its expiry"""
+        # Backdate so the entry expires no later than its own TTL allowed
+        stored_at = record.stored_at + min(record.ttl, self.ttl) - self.ttl
+        if time.time() - stored_at >= self.ttl:
+            return False
+        
+        return self._insert_main(record.key, record.value, stored_at, sys.intern(record.pair))
+    
+    def preload(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        translation: str
+    ) -> bool:
+        """
+        Warm the cache with a known-good translation (e.g. from translation memory)
+        
+        Unlike set(), the entry goes straight into the main region and is not
+        written to the disk tier. Existing entries are left alone.
+        
+        Returns:
+            True if the entry was added, False if present or the cache is full
+        """
+        if not self.enabled:
+            return False
+        
+        key = self._make_key(text, source_lang, target_lang)
+        pair = language_pair(source_lang, target_lang)
+        return self._insert_main(key, self._encode(translation), self._now(), pair)
+    
+    def _insert_main(self, key: bytes, value: Union[str, bytes], stored_at: float, pair: str) -> bool:
+        """Insert a warm entry into probation if there is room for it"""
+        if self._region_of(key) is not None:
+            return False
+        if len(self._probation) + len(self._protected) >= self.main_capacity:
+            return False
+        
+        size = sys.getsizeof(value) + ENTRY_OVERHEAD_BYTES
+        if self.total_bytes + size > self.max_bytes:
+            return False
+        
+        self._probation[key] = _Entry(value, stored_at, pair)
+        self._sketch.increment(key)
+        self._schedule_expiry(key, stored_at)
+        self.total_bytes += size
+        if value.__class__ is bytes:
+            self.compressed_entries += 1
+        
+        stats = self._pair_stats(pair)
+        stats.entries += 1
+        stats.bytes += size
+        return True
+    
+    async def close(self):
+        """Snapshot the cache, stop background tasks and close the disk tier"""
+        refreshes = list(self._refresh_tasks)
+        for task in refreshes:
+            task.cancel()
+        # Wait for them to unwind so none writes to a store closed after us
+        await asyncio.gather(*refreshes, return_exceptions=True)
+        
+        if self._snapshot_task is not None:
+            self._snapshot_task.cancel()
+            try:
+                await self._snapshot_task
+            except asyncio.CancelledError:
+                pass
+            self._snapshot_task = None
+            
+            # Only overwrite the snapshot once it has been loaded, so a short-lived
+            # process can't replace a warm snapshot with its own few entries
+            if self._snapshot_restored:
+                try:
+                    await self.save_snapshot()
+                except Exception as e:
+                    logger.error(f"Cache snapshot failed: {e}")
+        
+        if self._sweeper_task is not None:
+            self._sweeper_task.cancel()
+            try:
+                await self._sweeper_task
+            except asyncio.CancelledError:
+                pass
+            self._sweeper_task = None
+        
+        if self.l2 is not None:
+            await asyncio.to_thread(self.l2.close)
+            self.l2 = None
+    
+    def __len__(self) -> int:
+        return len(self._window) + len(self._probation) + len(self._protected)
+    
+    def get_stats(self) -> dict:
+        """Get cache statistics (constant time in the number of entries)"""
+        total_entries = len(self)
+        lookups = self.hits + self.misses
+        
         return {
-            "total_entries": len(self.cache),
-            "active_entries": active_entries,
-            "expired_entries": len(self.cache) - active_entries,
+            "total_entries": total_entries,
+            # Expired entries are never served and are swept within sweep_interval
+            "active_entries": total_entries,
             "ttl_seconds": self.ttl,
-            "enabled": self.enabled
+            "enabled": self.enabled,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "bytes": self.total_bytes,
+            "bytes_per_entry": self.total_bytes / total_entries if total_entries > 0 else 0,
+            "compressed_entries": self.compressed_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups > 0 else 0,
+            "expirations": self.expirations,
+            "evictions": self.evictions,
+            "rejections": self.rejections,
+            "sweeps": self.sweeps,
+            "swr": {
+                "grace_seconds": self.stale_grace,
+                "stale_hits": self.stale_hits,
+                "refreshes": self.refreshes,
+                "in_flight": len(self._refreshing),
+                "deduplicated": self.refreshes_deduplicated,
+                "throttled": self.refreshes_throttled,
+                "failures": self.refresh_failures
+            },
+            "snapshot": {
+                "enabled": self.snapshot_enabled,
+                "saved": self.snapshots_saved,
+                "restored_entries": self.snapshot_restored_entries
+            },
+            "regions": {
+                "window": len(self._window),
+                "probation": len(self._probation),
+                "protected": len(self._protected)
+            },
+            "language_pairs": {
+                pair: stats.as_dict() for pair, stats in self._pairs.items()
+            },
+            "l2": self.l2.get_stats() if self.l2 is not None else {"enabled": False}
         }
-
@@ -0,0 +1,135 @@
+"""
+Cache Snapshot
+
+Versioned binary snapshot of the in-memory translation cache, so restarts
+(including PM2's max_memory_restart) come back warm.
+
+Layout (little-endian):
+
+    header  magic "RTCS" | version u16 | created_at f64 | count u32
+    record  key 16s | stored_at f64 | ttl u32 | flags u8 | pair_len u8 | value_len u32
+            pair bytes | value bytes
+
+Records are written hottest first. stored_at and ttl are kept per entry, so
+restored entries expire when they would have without the restart.
+"""
+
+import os
+import struct
+import time
+from typing import Iterable, List, NamedTuple, Union
+from ..utils.logger import get_logger
+
+logger = get_logger("cache_snapshot")
+
+SNAPSHOT_MAGIC = b"RTCS"
+SNAPSHOT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHdI")
+_RECORD = struct.Struct("<16sdIBBI")
+
+# Record flags
+FLAG_COMPRESSED = 0x01
+
+
+class SnapshotRecord(NamedTuple):
+    """One cache entry as stored in a snapshot"""
+    key: bytes
+    value: Union[str, bytes]  # bytes = zlib-compressed UTF-8
+    stored_at: float
+    ttl: int
+    pair: str
+
+
+def write_snapshot(path: str, records: Iterable[SnapshotRecord]) -> int:
+    """
+    Write records to path atomically
+
+    Args:
+        path: Snapshot file path
+        records: Entries, hottest first
+
+    Returns:
+        Number of records written
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    # Several processes may snapshot to the same path; each writes its own temp file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    count = 0
+
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, time.time(), 0))
+
+        for record in records:
+            if isinstance(record.value, bytes):
+                flags, value = FLAG_COMPRESSED, record.value
+            else:
+                flags, value = 0, record.value.encode("utf-8")
+            pair = record.pair.encode()
+
+            f.write(_RECORD.pack(record.key, record.stored_at, record.ttl, flags, len(pair), len(value)))
+            f.write(pair)
+            f.write(value)
+            count += 1
+
+        # Patch the record count into the header
+        f.seek(0)
+        f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, time.time(), count))
+
+    os.replace(tmp_path, path)
+    return count
+
+
+def read_snapshot(path: str) -> List[SnapshotRecord]:
+    """
+    Read unexpired records from a snapshot
+
+    Missing, foreign or newer-version files yield no records; a truncated
+    file yields the records before the damage.
+    """
+    if not os.path.exists(path):
+        return []
+
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if len(data) < _HEADER.size:
+        logger.warning(f"⚠️  Ignoring truncated cache snapshot {path}")
+        return []
+
+    magic, version, _, count = _HEADER.unpack_from(data, 0)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        logger.warning(f"⚠️  Ignoring cache snapshot {path} (format {magic!r} v{version})")
+        return []
+
+    now = time.time()
+    records = []
+    offset = _HEADER.size
+
+    for _ in range(count):
+        if offset + _RECORD.size > len(data):
+            break
+        key, stored_at, ttl, flags, pair_len, value_len = _RECORD.unpack_from(data, offset)
+        offset += _RECORD.size
+
+        end = offset + pair_len + value_len
+        if end > len(data):
+            break
+        pair = data[offset:offset + pair_len].decode()
+        value = data[offset + pair_len:end]
+        offset = end
+
+        if now - stored_at >= ttl:
+            continue
+
+        if not flags & FLAG_COMPRESSED:
+            value = value.decode("utf-8")
+        records.append(SnapshotRecord(key, value, stored_at, ttl, pair))
+
+    if len(records) < count:
+        logger.debug(f"Skipped {count - len(records)} expired or truncated snapshot records")
+
+    return records
@@ -4,12 +4,17 @@ Database Service
 SQLite database operations for translation storage and translation memory
 """
 
-import aiosqlite
+import asyncio
 import os
+import time
 import hashlib
-from typing import Optional, List, Dict
+from typing import AsyncIterator, Optional, List, Dict, Tuple
 from pathlib import Path
+from .sqlite_pool import SQLiteConnectionManager
 from ..core.config_loader import get_config_loader
+from ..utils.logger import get_logger
+
+logger = get_logger("database_service")
 
 
 class DatabaseService:
@@ -28,10 +33,55 @@ class DatabaseService:
         
         # Ensure data directory exists
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        # Long-lived writer + pooled readers (WAL mode)
+        pool_config = db_config.get("pool", {})
+        self.pool = SQLiteConnectionManager(
+            self.db_path,
+            read_connections=pool_config.get("read_connections", 4),
+            pragmas=pool_config.get("pragmas"),
+            cached_statements=pool_config.get("cached_statements", 256)
+        )
+        
+        # Write-behind queue for analytics rows
+        queue_config = db_config.get("write_queue", {})
+        self.write_queue_size = queue_config.get("max_size", 10000)
+        self.write_batch_size = queue_config.get("batch_size", 100)
+        self.write_flush_interval = queue_config.get("flush_interval_ms", 5) / 1000
+        self.usage_flush_interval = queue_config.get("usage_flush_interval_ms", 2000) / 1000
+        
+        # Translation memory usage bumps, accumulated in memory and flushed in batches
+        # key: (source_hash, source_lang, target_lang) -> [count, last_used]
+        self._usage_bumps: Dict[Tuple[str, str, str], list] = {}
+        
+        self._initialized = False
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self.rows_written = 0
+        self.write_batches = 0
+        self.write_errors = 0
+    
+    _TRANSLATION_MEMORY_SCHEMA = """
+        CREATE TABLE IF NOT EXISTS {table} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source_hash TEXT NOT NULL,
+            source_text TEXT NOT NULL,
+            source_lang TEXT NOT NULL,
+            target_lang TEXT NOT NULL,
+            translation TEXT NOT NULL,
+            usage_count INTEGER DEFAULT 1,
+            last_used TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE (source_hash, source_lang, target_lang)
+        )
+    """
     
     async def initialize(self):
         """Create tables if they don't exist"""
-        async with aiosqlite.connect(self.db_path) as db:
+        if self._initialized:
+            return
+        
+        async with self.pool.writer() as db:
             # Translations table
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS translations (
@@ -45,30 +95,56 @@ class DatabaseService:
                 )
             """)
             
-            # Translation memory table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS translation_memory (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    source_hash TEXT UNIQUE NOT NULL,
-                    source_text TEXT NOT NULL,
-                    source_lang TEXT NOT NULL,
-                    target_lang TEXT NOT NULL,
-                    translation TEXT NOT NULL,
-                    usage_count INTEGER DEFAULT 1,
-                    last_used TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+            # Translation memory table - one row per (source text, language pair)
+            await db.execute(self._TRANSLATION_MEMORY_SCHEMA.format(table="translation_memory"))
             
-            # Create index for faster lookups
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_translation_memory_hash 
-                ON translation_memory(source_hash, source_lang, target_lang)
-            """)
+            await self._migrate_translation_memory(db)
+            
+            # The composite UNIQUE constraint already provides the lookup index
+            await db.execute("DROP INDEX IF EXISTS idx_translation_memory_hash")
             
             await db.commit()
+            self._initialized = True
             logger.info("✅ SQLite database initialized (FREE!)")
     
+    async def _migrate_translation_memory(self, db):
+        """
+        Migrate the legacy schema where source_hash alone was UNIQUE
+        
+        That constraint allowed only one target language per source text.
+        Rows are copied into a table keyed by (source_hash, source_lang, target_lang).
+        """
+        legacy = False
+        async with db.execute("PRAGMA index_list(translation_memory)") as cursor:
+            indexes = await cursor.fetchall()
+        
+        for index in indexes:
+            name, unique = index[1], index[2]
+            if not unique:
+                continue
+            async with db.execute(f"PRAGMA index_info('{name}')") as cursor:
+                columns = [row[2] for row in await cursor.fetchall()]
+            if columns == ["source_hash"]:
+                legacy = True
+                break
+        
+        if not legacy:
+            return
+        
+        logger.info("🔧 Migrating translation_memory to composite (hash, source, target) key...")
+        await db.execute(self._TRANSLATION_MEMORY_SCHEMA.format(table="translation_memory_new"))
+        await db.execute("""
+            INSERT OR IGNORE INTO translation_memory_new
+            (source_hash, source_text, source_lang, target_lang, translation,
+             usage_count, last_used, created_at)
+            SELECT source_hash, source_text, source_lang, target_lang, translation,
+                   usage_count, last_used, created_at
+            FROM translation_memory
+        """)
+        await db.execute("DROP TABLE translation_memory")
+        await db.execute("ALTER TABLE translation_memory_new RENAME TO translation_memory")
+        logger.info("✅ translation_memory migrated")
+    
     async def save_translation(
         self,
         source_text: str,
@@ -78,7 +154,7 @@ class DatabaseService:
         quality_score: Optional[float] = None
     ):
         """Save translation for analytics"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute(
                 """
                 INSERT INTO translations 
@@ -89,49 +165,185 @@ class DatabaseService:
             )
             await db.commit()
     
-    async def save_to_memory(
+    async def enqueue_translation(
         self,
         source_text: str,
         source_lang: str,
         target_lang: str,
-        translation: str
+        translation: str,
+        quality_score: Optional[float] = None
     ):
-        """Save translation to memory for future use"""
-        text_hash = hashlib.md5(source_text.encode()).hexdigest()
+        """
+        Queue a translation for analytics without waiting for the write
         
-        async with aiosqlite.connect(self.db_path) as db:
-            # Check if exists
-            async with db.execute(
-                """
-                SELECT id, usage_count FROM translation_memory
-                WHERE source_hash = ? AND source_lang = ? AND target_lang = ?
-                """,
-                (text_hash, source_lang, target_lang)
-            ) as cursor:
-                row = await cursor.fetchone()
+        Rows are group-committed by a background writer. This only blocks
+        when the queue is full.
+        """
+        self._ensure_writer()
+        await self._write_queue.put(
+            (source_text, source_lang, target_lang, translation, quality_score)
+        )
+    
+    def _ensure_writer(self):
+        """Start the background writer on first use"""
+        if self._writer_task is None or self._writer_task.done():
+            self._write_queue = self._write_queue or asyncio.Queue(maxsize=self.write_queue_size)
+            self._writer_task = asyncio.create_task(self._writer_loop())
+    
+    async def _writer_loop(self):
+        """Drain the write queue, committing rows in batches"""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            try:
+                async with asyncio.timeout(self.usage_flush_interval):
+                    first = await self._write_queue.get()
+            except TimeoutError:
+                # Idle - flush accumulated translation memory usage bumps
+                if self._usage_bumps:
+                    try:
+                        await self._write_rows([])
+                    except Exception as e:
+                        self.write_errors += 1
+                        logger.error(f"❌ Failed to flush translation memory usage: {e}")
+                continue
+            
+            rows = [first]
+            deadline = loop.time() + self.write_flush_interval
+            
+            # Collect more rows until the batch is full or the interval elapses
+            while len(rows) < self.write_batch_size:
+                try:
+                    rows.append(self._write_queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
                 
-                if row:
-                    # Update existing entry
-                    await db.execute(
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    async with asyncio.timeout(remaining):
+                        rows.append(await self._write_queue.get())
+                except TimeoutError:
+                    break
+            
+            try:
+                await self._write_rows(rows)
+            except Exception as e:
+                self.write_errors += 1
+                logger.error(f"❌ Failed to write {len(rows)} translations: {e}")
+            finally:
+                for _ in rows:
+                    self._write_queue.task_done()
+    
+    async def _write_rows(self, rows: List[Tuple]):
+        """Insert a batch of translation rows and pending usage bumps in one transaction"""
+        usage, self._usage_bumps = self._usage_bumps, {}
+        
+        try:
+            async with self.pool.writer() as db:
+                if rows:
+                    await db.executemany(
                         """
-                        UPDATE translation_memory
-                        SET usage_count = usage_count + 1,
-                            last_used = CURRENT_TIMESTAMP
-                        WHERE id = ?
+                        INSERT INTO translations 
+                        (source_text, source_lang, target_lang, translation, quality_score)
+                        VALUES (?, ?, ?, ?, ?)
                         """,
-                        (row[0],)
+                        rows
                     )
-                else:
-                    # Insert new entry
-                    await db.execute(
+                if usage:
+                    await db.executemany(
                         """
-                        INSERT INTO translation_memory
-                        (source_hash, source_text, source_lang, target_lang, translation)
-                        VALUES (?, ?, ?, ?, ?)
+                        UPDATE translation_memory
+                        SET usage_count = usage_count + ?,
+                            last_used = datetime(?, 'unixepoch')
+                        WHERE source_hash = ? AND source_lang = ? AND target_lang = ?
                         """,
-                        (text_hash, source_text, source_lang, target_lang, translation)
+                        [(count, last_used, *key) for key, (count, last_used) in usage.items()]
                     )
-            
+                await db.commit()
+        except BaseException:
+            # Keep the usage bumps for the next attempt
+            for key, (count, last_used) in usage.items():
+                bump = self._usage_bumps.setdefault(key, [0, 0.0])
+                bump[0] += count
+                bump[1] = max(bump[1], last_used)
+            raise
+        
+        self.rows_written += len(rows)
+        self.write_batches += 1
+    
+    def _record_usage(self, text_hash: str, source_lang: str, target_lang: str):
+        """Accumulate a translation memory hit to be flushed by the writer"""
+        bump = self._usage_bumps.setdefault((text_hash, source_lang, target_lang), [0, 0.0])
+        bump[0] += 1
+        bump[1] = time.time()
+        self._ensure_writer()
+    
+    def get_queue_depth(self) -> int:
+        """Number of translations waiting to be written"""
+        return self._write_queue.qsize() if self._write_queue else 0
+    
+    async def flush(self):
+        """Wait until every queued translation and usage bump has been written"""
+        if self._write_queue is not None and self._writer_task is not None:
+            await self._write_queue.join()
+        
+        if self._usage_bumps:
+            await self._write_rows([])
+    
+    async def close(self):
+        """Flush pending writes, stop the background writer and close connections"""
+        await self.flush()
+        
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+        
+        await self.pool.close()
+        
+        logger.info(f"💾 Database writer stopped ({self.rows_written} rows written)")
+    
+    def get_stats(self) -> Dict:
+        """Get write-behind queue statistics"""
+        return {
+            "write_queue_depth": self.get_queue_depth(),
+            "write_queue_size": self.write_queue_size,
+            "rows_written": self.rows_written,
+            "write_batches": self.write_batches,
+            "write_errors": self.write_errors,
+            "pending_usage_updates": len(self._usage_bumps),
+            "connections": self.pool.get_stats()
+        }
+    
+    async def save_to_memory(
+        self,
+        source_text: str,
+        source_lang: str,
+        target_lang: str,
+        translation: str
+    ):
+        """Save translation to memory for future use"""
+        text_hash = hashlib.md5(source_text.encode()).hexdigest()
+        
+        async with self.pool.writer() as db:
+            await db.execute(
+                """
+                INSERT INTO translation_memory
+                (source_hash, source_text, source_lang, target_lang, translation)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (source_hash, source_lang, target_lang) DO UPDATE SET
+                    translation = excluded.translation,
+                    usage_count = usage_count + 1,
+                    last_used = CURRENT_TIMESTAMP
+                """,
+                (text_hash, source_text, source_lang, target_lang, translation)
+            )
             await db.commit()
     
     async def get_from_memory(
@@ -143,7 +355,7 @@ class DatabaseService:
         """Get cached translation from memory"""
         text_hash = hashlib.md5(source_text.encode()).hexdigest()
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.reader() as db:
             async with db.execute(
                 """
                 SELECT translation FROM translation_memory
@@ -152,26 +364,117 @@ class DatabaseService:
                 (text_hash, source_lang, target_lang)
             ) as cursor:
                 row = await cursor.fetchone()
-                
-                if row:
-                    # Update usage count
-                    await db.execute(
-                        """
-                        UPDATE translation_memory
-                        SET usage_count = usage_count + 1,
-                            last_used = CURRENT_TIMESTAMP
-                        WHERE source_hash = ? AND source_lang = ? AND target_lang = ?
-                        """,
-                        (text_hash, source_lang, target_lang)
-                    )
-                    await db.commit()
-                    return row[0]
         
-        return None
+        if not row:
+            return None
+        
+        # Usage count is bumped in batches by the background writer
+        self._record_usage(text_hash, source_lang, target_lang)
+        return row[0]
+    
+    async def get_from_memory_many(
+        self,
+        source_text: str,
+        source_lang: str,
+        target_langs: List[str]
+    ) -> Dict[str, str]:
+        """
+        Get cached translations for several target languages in one query
+        
+        Returns:
+            Dictionary of {target_lang: translation} for the languages found
+        """
+        if not target_langs:
+            return {}
+        
+        text_hash = hashlib.md5(source_text.encode()).hexdigest()
+        placeholders = ", ".join("?" for _ in target_langs)
+        
+        async with self.pool.reader() as db:
+            async with db.execute(
+                f"""
+                SELECT target_lang, translation FROM translation_memory
+                WHERE source_hash = ? AND source_lang = ? AND target_lang IN ({placeholders})
+                """,
+                (text_hash, source_lang, *target_langs)
+            ) as cursor:
+                rows = await cursor.fetchall()
+        
+        for target_lang, _ in rows:
+            self._record_usage(text_hash, source_lang, target_lang)
+        
+        return {target_lang: translation for target_lang, translation in rows}
+    
+    async def save_to_memory_many(
+        self,
+        source_text: str,
+        source_lang: str,
+        translations: Dict[str, str]
+    ):
+        """Save translations for several target languages in one transaction"""
+        if not translations:
+            return
+        
+        text_hash = hashlib.md5(source_text.encode()).hexdigest()
+        
+        async with self.pool.writer() as db:
+            await db.executemany(
+                """
+                INSERT INTO translation_memory
+                (source_hash, source_text, source_lang, target_lang, translation)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (source_hash, source_lang, target_lang) DO UPDATE SET
+                    translation = excluded.translation,
+                    usage_count = usage_count + 1,
+                    last_used = CURRENT_TIMESTAMP
+                """,
+                [
+                    (text_hash, source_text, source_lang, target_lang, translation)
+                    for target_lang, translation in translations.items()
+                ]
+            )
+            await db.commit()
+    
+    async def iter_top_memory(
+        self,
+        limit: int,
+        half_life_days: float = 7.0,
+        batch_size: int = 500
+    ) -> AsyncIterator[List[Tuple[str, str, str, str]]]:
+        """
+        Stream the most valuable translation memory rows, best first
+        
+        Rows are ranked by recency-weighted usage, so a phrase used often last
+        week outranks one used slightly more often last year:
+        usage_count / (1 + days_since_last_used / half_life_days)
+        
+        Args:
+            limit: Maximum number of rows
+            half_life_days: Age at which a row's usage counts half
+            batch_size: Rows fetched per batch
+        
+        Yields:
+            Batches of (source_text, source_lang, target_lang, translation)
+        """
+        async with self.pool.reader() as db:
+            async with db.execute(
+                """
+                SELECT source_text, source_lang, target_lang, translation
+                FROM translation_memory
+                ORDER BY usage_count / (1.0 + MAX(julianday('now') - julianday(last_used), 0) / ?) DESC
+                LIMIT ?
+                """,
+                (half_life_days, limit)
+            ) as cursor:
+                while True:
+                    rows = await cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield rows
     
     async def get_translation_stats(self) -> Dict:
         """Get statistics about translations"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.reader() as db:
             # Total translations
             async with db.execute("SELECT COUNT(*) FROM translations") as cursor:
                 total_translations = (await cursor.fetchone())[0]
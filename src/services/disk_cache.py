@@ -0,0 +1,157 @@
+"""
+Disk Cache Tier
+
+Shared L2 translation cache on local disk (diskcache, SQLite in WAL mode).
+
+Every process on the node - Discord bot, Telegram bot and each API worker -
+opens the same directory, so a phrase translated by one process is a warm
+hit for the others. Reads are synchronous (local SQLite lookups); writes are
+handed to a background thread so requests never wait on disk.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+import threading
+import time
+from typing import Optional, Dict, Any, Tuple
+from ..utils.logger import get_logger
+
+logger = get_logger("disk_cache")
+
+try:
+    import diskcache
+except ImportError:  # pragma: no cover - optional dependency
+    diskcache = None
+
+
+class DiskCacheTier:
+    """Process-shared L2 cache with its own TTL and size bound"""
+
+    def __init__(
+        self,
+        directory: str = "data/cache",
+        ttl: int = 604800,
+        max_bytes: int = 512 * 1024 * 1024,
+        max_pending_writes: int = 1000
+    ):
+        """
+        Initialize disk cache tier
+
+        Args:
+            directory: Cache directory shared by all processes on the node
+            ttl: Seconds an entry stays valid on disk
+            max_bytes: Size limit before diskcache culls old entries
+            max_pending_writes: Writes buffered before new ones are dropped
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.max_pending_writes = max_pending_writes
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.dropped_writes = 0
+        self.errors = 0
+        self._pending_writes = 0
+        # Counters touched by both the event loop and the writer thread
+        self._lock = threading.Lock()
+
+        self._cache = diskcache.Cache(
+            directory,
+            size_limit=max_bytes,
+            eviction_policy="least-recently-stored"
+        )
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cache-l2")
+
+        logger.info(f"✅ Shared disk cache at {directory} ({max_bytes // (1024 * 1024)}MB)")
+
+    @classmethod
+    def from_config(cls, cache_config: Dict[str, Any]) -> Optional["DiskCacheTier"]:
+        """Create the tier from the cache.l2 config section (None if disabled)"""
+        l2_config = cache_config.get("l2", {})
+        if not l2_config.get("enabled", False):
+            return None
+
+        if diskcache is None:
+            logger.warning("⚠️  diskcache not installed - shared disk cache disabled")
+            return None
+
+        try:
+            return cls(
+                directory=os.getenv("CACHE_DIR", l2_config.get("directory", "data/cache")),
+                ttl=int(l2_config.get("ttl", 604800)),
+                max_bytes=int(l2_config.get("max_bytes", 512 * 1024 * 1024)),
+                max_pending_writes=int(l2_config.get("max_pending_writes", 1000))
+            )
+        except Exception as e:
+            logger.warning(f"⚠️  Could not open shared disk cache: {e}")
+            return None
+
+    def get(self, key: bytes) -> Optional[Tuple[str, float]]:
+        """
+        Read an entry (expired entries are treated as misses)
+
+        Returns:
+            (translation, stored_at) so callers can apply their own, shorter TTL
+        """
+        try:
+            value, expire_time = self._cache.get(key, expire_time=True)
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+            logger.debug(f"Disk cache read failed: {e}")
+            return None
+
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        stored_at = expire_time - self.ttl if expire_time is not None else time.time()
+        return value, stored_at
+
+    def set(self, key: bytes, value: str):
+        """Queue an asynchronous write"""
+        with self._lock:
+            if self._pending_writes >= self.max_pending_writes:
+                self.dropped_writes += 1
+                return
+            self._pending_writes += 1
+
+        self._writer.submit(self._write, key, value)
+
+    def _write(self, key: bytes, value: str):
+        """Write an entry (runs on the writer thread)"""
+        failed = True
+        try:
+            self._cache.set(key, value, expire=self.ttl)
+            failed = False
+        except Exception as e:
+            logger.debug(f"Disk cache write failed: {e}")
+        finally:
+            with self._lock:
+                self._pending_writes -= 1
+                if failed:
+                    self.errors += 1
+                else:
+                    self.writes += 1
+
+    def close(self):
+        """Finish pending writes and close the cache"""
+        self._writer.shutdown(wait=True)
+        self._cache.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get disk tier statistics"""
+        return {
+            "directory": self.directory,
+            "ttl_seconds": self.ttl,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "pending_writes": self._pending_writes,
+            "dropped_writes": self.dropped_writes,
+            "errors": self.errors
+        }
@@ -0,0 +1,110 @@
+"""
+Provider Client Manager
+
+Long-lived, pooled HTTP clients for the translation providers.
+
+One httpx.AsyncClient per provider keeps connections (and their TLS
+sessions) alive between translations instead of paying TCP + TLS setup on
+every call. HTTP/2 is used when the h2 package is installed; upstreams that
+don't negotiate it fall back to HTTP/1.1 transparently.
+"""
+
+import importlib.util
+from typing import Any, Callable, Dict, Optional
+import httpx
+from ..core.config_loader import get_config_loader
+from ..utils.logger import get_logger
+
+logger = get_logger("provider_clients")
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class ProviderClientManager:
+    """Owns one pooled HTTP client (and SDK client) per provider"""
+
+    def __init__(self, http_config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize client manager
+
+        Args:
+            http_config: providers.http config section (read from config if None)
+        """
+        if http_config is None:
+            config = get_config_loader().get_config()
+            http_config = dict(config.get("providers", {}).get("http", {}))
+
+            # Match the pool to how many provider calls we run at once
+            roma_concurrency = config.get("roma", {}).get("executor", {}).get("max_concurrent", 5)
+            batch_concurrency = config.get("translation", {}).get("batch", {}).get("max_concurrent", 10)
+            http_config.setdefault("max_connections", max(roma_concurrency, batch_concurrency) * 2)
+
+        self.http2 = bool(http_config.get("http2", True)) and HTTP2_AVAILABLE
+        if http_config.get("http2", True) and not HTTP2_AVAILABLE:
+            logger.debug("h2 not installed - provider clients use HTTP/1.1")
+
+        self.limits = httpx.Limits(
+            max_connections=int(http_config.get("max_connections", 20)),
+            max_keepalive_connections=int(http_config.get("max_keepalive_connections", 10)),
+            keepalive_expiry=float(http_config.get("keepalive_expiry", 60))
+        )
+        self.timeout = httpx.Timeout(
+            float(http_config.get("timeout", 30)),
+            connect=float(http_config.get("connect_timeout", 5))
+        )
+
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._sdk_clients: Dict[str, Any] = {}
+        self.clients_created = 0
+
+    def get_client(self, provider: str) -> httpx.AsyncClient:
+        """Get the pooled client for a provider (created on first use)"""
+        client = self._clients.get(provider)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=self.limits,
+                timeout=self.timeout
+            )
+            self._clients[provider] = client
+            self.clients_created += 1
+        return client
+
+    def get_sdk_client(self, provider: str, factory: Callable[[], Any]) -> Any:
+        """Get a reusable SDK client (e.g. deepl.Translator), built once by factory"""
+        client = self._sdk_clients.get(provider)
+        if client is None:
+            client = factory()
+            self._sdk_clients[provider] = client
+        return client
+
+    async def start(self, providers):
+        """Create clients up front so the first translation doesn't pay for it"""
+        for provider in providers:
+            self.get_client(provider)
+        logger.info(
+            f"✅ Provider HTTP clients ready ({'HTTP/2' if self.http2 else 'HTTP/1.1'}, "
+            f"max {self.limits.max_connections} connections)"
+        )
+
+    async def aclose(self):
+        """Close all pooled clients"""
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+
+        for sdk_client in self._sdk_clients.values():
+            close = getattr(sdk_client, "close", None)
+            if close is not None:
+                close()
+        self._sdk_clients.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get client pool statistics"""
+        return {
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "open_clients": sorted(name for name, client in self._clients.items() if not client.is_closed),
+            "clients_created": self.clients_created
+        }
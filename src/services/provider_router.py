@@ -0,0 +1,202 @@
+"""
+Provider Router
+
+Orders translation providers per call by a score of quality preference,
+observed latency and health, instead of a fixed fallback order.
+
+Latency and error rate are tracked as EWMAs per provider and language pair,
+falling back to the provider-wide figures for pairs without data yet.
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from ..core.config_loader import get_config_loader
+from ..utils.validators import stats_language
+
+# Default quality preference by provider client name
+DEFAULT_QUALITY = {
+    "deepl": 1.0,
+    "azure": 0.9,
+    "libretranslate": 0.6,
+}
+
+# Key for a provider's stats across all language pairs
+ALL_PAIRS = "*"
+
+
+class _RouteStats:
+    """EWMA latency and error rate for one provider (and pair)"""
+
+    __slots__ = ("latency", "error_rate", "calls", "failures", "updated_at")
+
+    def __init__(self):
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.calls = 0
+        self.failures = 0
+        self.updated_at = time.time()
+
+
+class ProviderRouter:
+    """Scores and ranks providers for each language pair"""
+
+    def __init__(self, routing_config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize router
+
+        Args:
+            routing_config: providers.routing config section (read from config if None)
+        """
+        if routing_config is None:
+            routing_config = get_config_loader().get_config().get("providers", {}).get("routing", {})
+
+        weights = routing_config.get("weights", {})
+        self.quality_weight = float(weights.get("quality", 0.5))
+        self.latency_weight = float(weights.get("latency", 0.3))
+        self.health_weight = float(weights.get("health", 0.2))
+        self.quota_weight = float(weights.get("quota", 0.5))
+
+        self.quality = {**DEFAULT_QUALITY, **routing_config.get("quality", {})}
+        self.latency_target = float(routing_config.get("latency_target_ms", 500)) / 1000
+        self.alpha = float(routing_config.get("ewma_alpha", 0.2))
+        # Failures fade so a provider that stopped getting traffic can win again
+        self.error_half_life = float(routing_config.get("error_half_life_seconds", 300))
+
+        self._stats: Dict[Tuple[str, str, str], _RouteStats] = {}
+        self.decisions: Dict[str, int] = {}
+        self._client_names: Dict[str, str] = {}
+
+    def record(
+        self,
+        provider: str,
+        source_lang: Optional[str],
+        target_lang: str,
+        latency: float,
+        success: Optional[bool]
+    ):
+        """
+        Record a provider call
+
+        Args:
+            provider: Provider name
+            source_lang: Source language (None for auto-detect)
+            target_lang: Target language
+            latency: Call duration in seconds
+            success: Call outcome (None for a call cancelled by a hedge)
+        """
+        now = time.time()
+        pair_key = (provider, stats_language(source_lang), stats_language(target_lang))
+        for key in (pair_key, (provider, ALL_PAIRS, ALL_PAIRS)):
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = _RouteStats()
+
+            if stats.latency is None:
+                stats.latency = latency
+            elif success is not False or latency > stats.latency:
+                # Fast failures shouldn't make a provider look quick
+                stats.latency += self.alpha * (latency - stats.latency)
+
+            stats.error_rate = self._error_rate(stats, now)
+            if success is not None:
+                stats.error_rate += self.alpha * ((0.0 if success else 1.0) - stats.error_rate)
+                stats.calls += 1
+                stats.failures += 0 if success else 1
+            stats.updated_at = now
+
+    def _error_rate(self, stats: _RouteStats, now: float) -> float:
+        """Error rate decayed by time since the last update"""
+        return stats.error_rate * 0.5 ** ((now - stats.updated_at) / self.error_half_life)
+
+    def _route_stats(self, provider: str, source_lang: Optional[str], target_lang: str) -> Optional[_RouteStats]:
+        """Pair stats, or provider-wide stats when the pair has no data"""
+        stats = self._stats.get((provider, stats_language(source_lang), stats_language(target_lang)))
+        if stats is None:
+            stats = self._stats.get((provider, ALL_PAIRS, ALL_PAIRS))
+        return stats
+
+    def _score(self, client_name: str, stats: Optional[_RouteStats], now: float) -> float:
+        """Weighted score from quality preference, latency and health"""
+        quality = self.quality.get(client_name, 0.5)
+
+        if stats is None or stats.latency is None:
+            latency_score = 0.5
+            health = 1.0
+        else:
+            latency_score = self.latency_target / (self.latency_target + stats.latency)
+            health = 1.0 - self._error_rate(stats, now)
+
+        return (
+            self.quality_weight * quality
+            + self.latency_weight * latency_score
+            + self.health_weight * health
+        )
+
+    def score(
+        self,
+        provider,
+        source_lang: Optional[str],
+        target_lang: str,
+        quota_pressure: float = 0.0
+    ) -> float:
+        """Score a provider for a pair (higher is better)"""
+        self._client_names[provider.name] = provider.client_name
+        stats = self._route_stats(provider.name, source_lang, target_lang)
+        return self._score(provider.client_name, stats, time.time()) - self.quota_weight * quota_pressure
+
+    def rank(
+        self,
+        providers: List,
+        source_lang: Optional[str],
+        target_lang: str,
+        quota_pressure: Optional[Dict[str, float]] = None
+    ) -> List:
+        """
+        Providers ordered best first (ties keep the configured order)
+
+        quota_pressure (0-1 per provider name) demotes providers forecast to
+        run out of monthly quota, moving traffic away before the hard limit.
+        Providers without a quota entry are the fallback tier: pressure can
+        reorder metered providers but never rank one below that tier, since
+        the forecast is noisy and a provider under pressure still has quota.
+        """
+        quota_pressure = quota_pressure or {}
+        scores = {p.name: self.score(p, source_lang, target_lang) for p in providers}
+        floor = max((scores[p.name] for p in providers if p.name not in quota_pressure), default=None)
+
+        def ranked_score(provider) -> float:
+            score = scores[provider.name]
+            penalized = score - self.quota_weight * quota_pressure.get(provider.name, 0.0)
+            if floor is not None and score >= floor:
+                penalized = max(penalized, floor)
+            return penalized
+
+        ranked = sorted(providers, key=lambda p: -ranked_score(p))
+        if ranked:
+            self.decisions[ranked[0].name] = self.decisions.get(ranked[0].name, 0) + 1
+        return ranked
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Routing decisions and per-pair latency/health"""
+        now = time.time()
+        pairs: Dict[str, Dict[str, Any]] = {}
+        for (provider, source, target), stats in self._stats.items():
+            pair = "all" if source == ALL_PAIRS else f"{source}->{target}"
+            pairs.setdefault(pair, {})[provider] = {
+                "score": round(self._score(self._client_names.get(provider, ""), stats, now), 3),
+                "latency_ms": round(stats.latency * 1000, 1) if stats.latency is not None else None,
+                "error_rate": round(self._error_rate(stats, now), 3),
+                "calls": stats.calls,
+                "failures": stats.failures
+            }
+
+        return {
+            "weights": {
+                "quality": self.quality_weight,
+                "latency": self.latency_weight,
+                "health": self.health_weight,
+                "quota": self.quota_weight
+            },
+            "primary_decisions": dict(self.decisions),
+            "pairs": pairs
+        }
@@ -0,0 +1,272 @@
+"""
+Quota Ledger
+
+Monthly provider character usage shared by every process through SQLite.
+
+Each process accumulates usage in memory and flushes it in batches with an
+upsert, then reads back the combined totals, so has_quota reflects what all
+bot/API processes have spent this month and survives restarts. The usage
+rate is used to forecast whether a provider will run out before the month
+ends, so routing can move traffic away from it ahead of the hard limit.
+"""
+
+import asyncio
+import calendar
+import math
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from .sqlite_pool import SQLiteConnectionManager
+from ..core.config_loader import get_config_loader
+from ..utils.logger import get_logger
+
+logger = get_logger("quota_ledger")
+
+
+def current_month() -> str:
+    """Quota period key (UTC calendar month)"""
+    return time.strftime("%Y-%m", time.gmtime())
+
+
+def seconds_left_in_month(now: Optional[float] = None) -> float:
+    """Seconds until the current UTC month ends"""
+    now = time.time() if now is None else now
+    t = time.gmtime(now)
+    next_month = (t.tm_year + t.tm_mon // 12, t.tm_mon % 12 + 1)
+    return calendar.timegm((*next_month, 1, 0, 0, 0)) - now
+
+
+class QuotaLedger:
+    """Durable, cross-process monthly usage per provider"""
+
+    def __init__(
+        self,
+        db_path: str,
+        flush_interval: float = 5.0,
+        soft_limit: float = 0.9,
+        forecast_horizon: float = 3600
+    ):
+        """
+        Initialize ledger
+
+        Args:
+            db_path: SQLite database shared by all processes
+            flush_interval: Seconds between batched writes (and reads of other processes' usage)
+            soft_limit: Forecast share of the monthly limit at which traffic starts moving away
+            forecast_horizon: Seconds of recent traffic the usage rate is averaged over
+        """
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self.soft_limit = soft_limit
+        self.forecast_horizon = forecast_horizon
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.pool = SQLiteConnectionManager(db_path, read_connections=1)
+
+        self.month = current_month()
+        # provider -> [characters, requests] not yet written
+        self._pending: Dict[str, List[int]] = {}
+        # Usage taken by a flush that hasn't been read back yet
+        self._flushing: Dict[str, List[int]] = {}
+        self._totals: Dict[str, int] = {}
+        self._rates: Dict[str, float] = {}
+        self._refreshed_at: Optional[float] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._schema_ready = False
+
+        self.flushes = 0
+        self.flush_errors = 0
+
+    @classmethod
+    def from_config(cls) -> Optional["QuotaLedger"]:
+        """Create the ledger from the providers.quota config section (None if disabled)"""
+        config = get_config_loader().get_config()
+        quota_config = config.get("providers", {}).get("quota", {})
+        if not quota_config.get("ledger", True):
+            return None
+
+        db_path = os.getenv("DATABASE_URL", config.get("database", {}).get("path", "data/translations.db"))
+        if db_path.startswith("sqlite:///"):
+            db_path = db_path.replace("sqlite:///", "")
+
+        return cls(
+            db_path=db_path,
+            flush_interval=float(quota_config.get("flush_interval", 5)),
+            soft_limit=float(quota_config.get("soft_limit", 0.9)),
+            forecast_horizon=float(quota_config.get("forecast_horizon", 3600))
+        )
+
+    async def _ensure_schema(self, db):
+        """Create the usage table on first use (flush may run without start())"""
+        if self._schema_ready:
+            return
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS provider_usage (
+                provider TEXT NOT NULL,
+                month TEXT NOT NULL,
+                characters INTEGER NOT NULL DEFAULT 0,
+                requests INTEGER NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (provider, month)
+            )
+        """)
+        await db.commit()
+        self._schema_ready = True
+
+    async def start(self):
+        """Create the table, load this month's totals and start the flush loop"""
+        await self.flush()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        logger.info(f"✅ Quota ledger ready ({len(self._totals)} providers with usage in {self.month})")
+
+    def record(self, provider: str, characters: int, requests: int = 1):
+        """Add usage; written with the next batch"""
+        pending = self._pending.setdefault(provider, [0, 0])
+        pending[0] += characters
+        pending[1] += requests
+
+    def used(self, provider: str) -> int:
+        """Characters used this month by all processes (including unflushed local usage)"""
+        return (
+            self._totals.get(provider, 0)
+            + self._pending.get(provider, (0, 0))[0]
+            + self._flushing.get(provider, (0, 0))[0]
+        )
+
+    def _month_average_rate(self, provider: str, now: float) -> float:
+        """Month-to-date characters per second"""
+        t = time.gmtime(now)
+        month_seconds = calendar.monthrange(t.tm_year, t.tm_mon)[1] * 86400
+        elapsed = month_seconds - seconds_left_in_month(now)
+        return self.used(provider) / max(elapsed, 1.0)
+
+    def _rate(self, provider: str, now: float) -> float:
+        """Recent characters per second, falling back to the month-to-date average"""
+        rate = self._rates.get(provider)
+        return rate if rate is not None else self._month_average_rate(provider, now)
+
+    def forecast(self, provider: str, limit: int) -> Dict[str, Any]:
+        """
+        Project month-end usage at the current rate
+
+        Returns:
+            Dict with used, projected usage, seconds until exhaustion (None if
+            it won't happen this month) and pressure (0 = fine, 1 = will run out)
+        """
+        now = time.time()
+        used = self.used(provider)
+        rate = self._rate(provider, now)
+        projected = used + rate * seconds_left_in_month(now)
+
+        exhausted_in = None
+        if used >= limit:
+            exhausted_in = 0.0
+        elif rate > 0 and projected >= limit:
+            exhausted_in = (limit - used) / rate
+
+        soft = self.soft_limit * limit
+        pressure = min(max((projected - soft) / max(limit - soft, 1), 0.0), 1.0)
+
+        return {
+            "used": used,
+            "limit": limit,
+            "projected": int(projected),
+            "exhausted_in": exhausted_in,
+            "pressure": round(pressure, 3)
+        }
+
+    async def _flush_loop(self):
+        """Periodically write pending usage and pick up other processes' usage"""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                self.flush_errors += 1
+                logger.error(f"❌ Failed to flush quota ledger: {e}")
+
+    async def flush(self):
+        """Write pending usage in one transaction and refresh totals"""
+        month = current_month()
+        pending, self._pending = self._pending, {}
+        self._flushing = pending
+        now = time.time()
+
+        try:
+            async with self.pool.writer() as db:
+                await self._ensure_schema(db)
+                if pending:
+                    await db.executemany(
+                        """
+                        INSERT INTO provider_usage (provider, month, characters, requests, updated_at)
+                        VALUES (?, ?, ?, ?, ?)
+                        ON CONFLICT (provider, month) DO UPDATE SET
+                            characters = characters + excluded.characters,
+                            requests = requests + excluded.requests,
+                            updated_at = excluded.updated_at
+                        """,
+                        [
+                            (provider, month, characters, requests, now)
+                            for provider, (characters, requests) in pending.items()
+                        ]
+                    )
+                    await db.commit()
+
+                async with db.execute(
+                    "SELECT provider, characters FROM provider_usage WHERE month = ?", (month,)
+                ) as cursor:
+                    totals = {provider: characters for provider, characters in await cursor.fetchall()}
+        except BaseException:
+            # Keep the usage for the next attempt
+            self._flushing = {}
+            for provider, (characters, requests) in pending.items():
+                self.record(provider, characters, requests)
+            raise
+
+        if month != self.month:
+            self.month = month
+            self._rates.clear()
+            self._refreshed_at = None
+        elif self._refreshed_at is not None:
+            # Rate from all processes' growth since the last refresh, averaged over forecast_horizon
+            elapsed = max(now - self._refreshed_at, 1e-3)
+            weight = 1 - math.exp(-elapsed / self.forecast_horizon)
+            for provider, total in totals.items():
+                rate = max(total - self._totals.get(provider, 0), 0) / elapsed
+                previous = self._rates.get(provider)
+                if previous is None:
+                    previous = self._month_average_rate(provider, now)
+                self._rates[provider] = previous + weight * (rate - previous)
+
+        self._totals = totals
+        self._flushing = {}
+        self._refreshed_at = now
+        self.flushes += 1
+
+    async def close(self):
+        """Flush remaining usage and stop the flush loop"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"❌ Failed to flush quota ledger on shutdown: {e}")
+        await self.pool.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get ledger statistics"""
+        return {
+            "month": self.month,
+            "usage": {provider: self.used(provider) for provider in set(self._totals) | set(self._pending)},
+            "pending_providers": len(self._pending),
+            "flushes": self.flushes,
+            "flush_errors": self.flush_errors
+        }
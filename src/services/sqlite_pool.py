@@ -0,0 +1,146 @@
+"""
+SQLite Connection Manager
+
+Long-lived aiosqlite connections: one writer plus a small pool of readers,
+opened once with WAL journaling and tuned pragmas.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Any
+import aiosqlite
+from ..utils.logger import get_logger
+
+logger = get_logger("sqlite_pool")
+
+
+DEFAULT_PRAGMAS: Dict[str, Any] = {
+    "synchronous": "NORMAL",       # Safe with WAL, avoids an fsync per commit
+    "mmap_size": 268435456,        # 256MB memory-mapped reads
+    "cache_size": -16000,          # 16MB page cache (negative = KiB)
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,          # Wait for other processes' write locks
+}
+
+
+class SQLiteConnectionManager:
+    """
+    Owns one writer connection and a pool of read connections
+    
+    Writes are serialized through the single writer; reads run concurrently
+    on pooled connections thanks to WAL mode. Each connection keeps its own
+    prepared statement cache, so repeated queries skip re-parsing.
+    """
+    
+    def __init__(
+        self,
+        db_path: str,
+        read_connections: int = 4,
+        pragmas: Optional[Dict[str, Any]] = None,
+        cached_statements: int = 256
+    ):
+        """
+        Initialize connection manager
+        
+        Args:
+            db_path: Path to the SQLite database file
+            read_connections: Number of pooled read connections
+            pragmas: PRAGMA overrides applied to every connection
+            cached_statements: Prepared statement cache size per connection
+        """
+        self.db_path = db_path
+        self.read_connections = max(1, read_connections)
+        self.pragmas = {**DEFAULT_PRAGMAS, **(pragmas or {})}
+        self.cached_statements = cached_statements
+        
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._readers: List[aiosqlite.Connection] = []
+        self._read_pool: Optional[asyncio.Queue] = None
+        self._write_lock: Optional[asyncio.Lock] = None
+        self._start_lock: Optional[asyncio.Lock] = None
+        self.journal_mode: Optional[str] = None
+    
+    async def _open(self) -> aiosqlite.Connection:
+        """Open a connection and apply pragmas"""
+        conn = aiosqlite.connect(self.db_path, cached_statements=self.cached_statements)
+        # Idle pooled connections must not keep the interpreter alive on exit
+        conn.daemon = True
+        await conn
+        
+        for name, value in self.pragmas.items():
+            await conn.execute(f"PRAGMA {name}={value}")
+        return conn
+    
+    async def start(self):
+        """Open the writer and reader connections (idempotent)"""
+        if self._writer is not None:
+            return
+        
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        
+        async with self._start_lock:
+            if self._writer is not None:
+                return
+            
+            writer = await self._open()
+            async with writer.execute("PRAGMA journal_mode=WAL") as cursor:
+                self.journal_mode = (await cursor.fetchone())[0]
+            
+            self._read_pool = asyncio.Queue()
+            for _ in range(self.read_connections):
+                reader = await self._open()
+                self._readers.append(reader)
+                self._read_pool.put_nowait(reader)
+            
+            self._write_lock = asyncio.Lock()
+            self._writer = writer
+            
+            logger.info(
+                f"✅ SQLite connections ready (journal={self.journal_mode}, "
+                f"readers={self.read_connections})"
+            )
+    
+    @asynccontextmanager
+    async def writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow the writer connection (callers must commit before leaving)"""
+        await self.start()
+        async with self._write_lock:
+            try:
+                yield self._writer
+            except BaseException:
+                await self._writer.rollback()
+                raise
+    
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a pooled read connection"""
+        await self.start()
+        conn = await self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put_nowait(conn)
+    
+    async def close(self):
+        """Close all connections"""
+        if self._writer is None:
+            return
+        
+        async with self._write_lock:
+            for conn in self._readers:
+                await conn.close()
+            await self._writer.close()
+            
+            self._readers = []
+            self._read_pool = None
+            self._writer = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get connection pool statistics"""
+        return {
+            "journal_mode": self.journal_mode,
+            "read_connections": self.read_connections,
+            "idle_readers": self._read_pool.qsize() if self._read_pool else 0,
+            "writer_busy": bool(self._write_lock and self._write_lock.locked())
+        }
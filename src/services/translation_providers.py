@@ -8,23 +8,262 @@ With built-in retry logic and error recovery.
 """
 
 import os
+import time
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, List
+from collections import deque
+from typing import Iterator, Optional, Dict, List, Tuple
 import httpx
+from .provider_clients import ProviderClientManager
+from .provider_router import ProviderRouter
+from .quota_ledger import QuotaLedger
+from ..core.config_loader import get_config_loader
 from ..utils.logger import get_logger
-from ..utils.error_recovery import retry_async, get_circuit_breaker, RetryStrategy
+from ..utils.error_recovery import (
+    retry_async, get_circuit_breaker, configure_circuit_breakers, configure_retry_budgets, RetryStrategy
+)
+from ..utils.rate_limit import AdaptiveLimiter, TokenBucket
+from ..utils.thread_pools import get_executor
+from ..utils.validators import stats_language
 
 logger = get_logger("translation_providers")
 
+# 4xx statuses that are still worth retrying (timeouts, rate limits, DeepL quota)
+TRANSIENT_CLIENT_STATUSES = {408, 425, 429, 456}
+
+# Statuses that mean "slow down" rather than "broken"
+OVERLOAD_STATUSES = {429, 503}
+
+
+class ProviderError(Exception):
+    """
+    Translation provider failure
+    
+    permanent=True means the same request will keep failing (unsupported
+    language, rejected input, bad credentials): it is not retried and the
+    provider is skipped for that language pair for a while.
+    """
+    
+    def __init__(
+        self,
+        message: str,
+        permanent: bool = False,
+        status_code: Optional[int] = None,
+        retry_after: Optional[float] = None
+    ):
+        super().__init__(message)
+        self.permanent = permanent
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def is_permanent_status(status_code: Optional[int]) -> bool:
+    """Client errors other than timeouts and rate limits won't succeed on retry"""
+    return status_code is not None and 400 <= status_code < 500 and status_code not in TRANSIENT_CLIENT_STATUSES
+
+
+def is_transient(error: BaseException) -> bool:
+    """Whether a provider error is worth retrying"""
+    return not getattr(error, "permanent", False)
+
+
+def is_overload(error: BaseException) -> bool:
+    """Whether a provider error means it is overloaded (rate limited or timing out)"""
+    if getattr(error, "status_code", None) in OVERLOAD_STATUSES:
+        return True
+    cause = error.__cause__ or error.__context__
+    return isinstance(error, (httpx.TimeoutException, asyncio.TimeoutError)) or isinstance(
+        cause, (httpx.TimeoutException, asyncio.TimeoutError)
+    )
+
+
+def _parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """Retry-After header in seconds (numeric form only)"""
+    value = response.headers.get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _http_error(prefix: str, e: httpx.HTTPStatusError) -> ProviderError:
+    """Convert an HTTP status error into a classified ProviderError"""
+    status = e.response.status_code
+    error_detail = e.response.text if hasattr(e.response, 'text') else str(e)
+    return ProviderError(
+        f"{prefix} (HTTP {status}): {error_detail}",
+        permanent=is_permanent_status(status),
+        status_code=status,
+        retry_after=_parse_retry_after(e.response)
+    )
+
+
+class NegativeCache:
+    """
+    Remembers provider x language pair combinations that failed permanently
+    
+    Entries expire after ttl so a provider that adds a language (or a fixed
+    API key) is picked up again without a restart.
+    """
+    
+    def __init__(self, ttl: int = 3600, max_entries: int = 1000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple[str, str, str], Tuple[float, str]] = {}
+        self.skips = 0
+    
+    def is_blocked(self, provider: str, source_lang: Optional[str], target_lang: str) -> bool:
+        """Check (and count) whether provider is known to fail for this pair"""
+        key = (provider, source_lang or "auto", target_lang)
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        
+        if time.time() >= entry[0]:
+            del self._entries[key]
+            return False
+        
+        self.skips += 1
+        return True
+    
+    def add(self, provider: str, source_lang: Optional[str], target_lang: str, reason: str):
+        """Remember a permanent failure"""
+        if len(self._entries) >= self.max_entries:
+            # Drop the entry closest to expiry
+            oldest = min(self._entries, key=lambda k: self._entries[k][0])
+            del self._entries[oldest]
+        
+        self._entries[(provider, source_lang or "auto", target_lang)] = (time.time() + self.ttl, reason[:200])
+    
+    def count_for(self, provider: str) -> int:
+        """Number of pairs currently skipped for a provider"""
+        return sum(1 for name, _, _ in self._entries if name == provider)
+    
+    def get_stats(self) -> Dict:
+        """Get negative cache statistics"""
+        now = time.time()
+        return {
+            "ttl_seconds": self.ttl,
+            "entries": len(self._entries),
+            "skips": self.skips,
+            "pairs": [
+                {
+                    "provider": provider,
+                    "pair": f"{source}->{target}",
+                    "reason": reason,
+                    "expires_in": max(0, int(expires_at - now))
+                }
+                for (provider, source, target), (expires_at, reason) in self._entries.items()
+            ]
+        }
+
+
+class HedgePolicy:
+    """
+    Decides when to hedge a slow provider call with a parallel one
+    
+    The hedge delay is a latency percentile of the provider for the language
+    pair; hedges are capped at budget_ratio extra calls per request so quota
+    isn't spent on duplicates.
+    """
+    
+    def __init__(
+        self,
+        enabled: bool = False,
+        percentile: float = 0.9,
+        budget_ratio: float = 0.05,
+        min_samples: int = 20,
+        min_delay: float = 0.05,
+        window: int = 200
+    ):
+        self.enabled = enabled
+        self.percentile = percentile
+        self.budget_ratio = budget_ratio
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.window = window
+        self._latencies: Dict[Tuple[str, str, str], deque] = {}
+        
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.budget_denied = 0
+    
+    def record(self, provider: str, source_lang: Optional[str], target_lang: str, latency: float):
+        """Record a call's latency (a cancelled call records its elapsed time)"""
+        key = (provider, stats_language(source_lang), stats_language(target_lang))
+        samples = self._latencies.get(key)
+        if samples is None:
+            samples = self._latencies[key] = deque(maxlen=self.window)
+        samples.append(latency)
+    
+    def delay_for(self, provider: str, source_lang: Optional[str], target_lang: str) -> Optional[float]:
+        """Seconds to wait for provider before hedging, or None to not hedge"""
+        samples = self._latencies.get((provider, stats_language(source_lang), stats_language(target_lang)))
+        if not self.enabled or samples is None or len(samples) < self.min_samples:
+            return None
+        
+        ordered = sorted(samples)
+        return max(ordered[min(int(len(ordered) * self.percentile), len(ordered) - 1)], self.min_delay)
+    
+    def try_acquire(self) -> bool:
+        """Take a hedge from the budget"""
+        if self.hedges + 1 > self.requests * self.budget_ratio:
+            self.budget_denied += 1
+            return False
+        self.hedges += 1
+        return True
+    
+    def get_stats(self) -> Dict:
+        """Get hedging statistics"""
+        return {
+            "enabled": self.enabled,
+            "percentile": self.percentile,
+            "budget_ratio": self.budget_ratio,
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_rate": self.hedges / self.requests if self.requests else 0,
+            "hedge_wins": self.hedge_wins,
+            "budget_denied": self.budget_denied,
+            "tracked_pairs": len(self._latencies)
+        }
+
 
 class TranslationProvider(ABC):
     """Base class for translation providers"""
     
-    def __init__(self):
+    # Key for this provider's pooled client (and circuit breaker)
+    client_name = ""
+    
+    def __init__(self, clients: Optional[ProviderClientManager] = None):
         self.name = self.__class__.__name__
         self.usage_count = 0
         self.error_count = 0
+        self.clients = clients or ProviderClientManager()
+        self.monthly_usage = 0
+        self.quota_month = time.strftime("%Y-%m")
+        # Shared usage across processes (set by MultiProviderTranslationService)
+        self.ledger: Optional[QuotaLedger] = None
+    
+    def _roll_quota_month(self):
+        """Free-tier quotas reset monthly: start counting again in a new month"""
+        month = time.strftime("%Y-%m")
+        if month != self.quota_month:
+            self.quota_month = month
+            self.monthly_usage = 0
+    
+    def _record_usage(self, characters: int):
+        """Count characters against the monthly quota"""
+        self.monthly_usage += characters
+        if self.ledger is not None:
+            self.ledger.record(self.client_name, characters)
+    
+    def quota_used(self) -> int:
+        """Characters used this month (by all processes when the ledger is available)"""
+        if self.ledger is not None:
+            return self.ledger.used(self.client_name)
+        self._roll_quota_month()
+        return self.monthly_usage
     
     @abstractmethod
     async def translate(self, text: str, source_lang: str, target_lang: str) -> str:
@@ -40,16 +279,21 @@ class TranslationProvider(ABC):
     def get_supported_languages(self) -> List[str]:
         """Get list of supported language codes"""
         pass
+    
+    def supports(self, target_lang: str) -> bool:
+        """Check if the provider can translate into target_lang"""
+        return target_lang.lower()[:2] in self.get_supported_languages()
 
 
 class DeepLProvider(TranslationProvider):
     """DeepL Translation Provider - Best Quality"""
     
-    def __init__(self):
-        super().__init__()
+    client_name = "deepl"
+    
+    def __init__(self, clients: Optional[ProviderClientManager] = None):
+        super().__init__(clients)
         self.api_key = os.getenv("DEEPL_API_KEY")
         self.monthly_limit = 500000
-        self.monthly_usage = 0
         
         if not self.api_key:
             logger.warning("⚠️  DeepL API key not found")
@@ -61,10 +305,12 @@ class DeepLProvider(TranslationProvider):
     
     @retry_async(
         max_retries=3,
-        strategy=RetryStrategy.EXPONENTIAL,
+        strategy=RetryStrategy.DECORRELATED_JITTER,
         base_delay=1.0,
         max_delay=10.0,
-        exceptions=(Exception,)
+        exceptions=(Exception,),
+        retry_if=is_transient,
+        budget="deepl"
     )
     async def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         """
@@ -74,41 +320,60 @@ class DeepLProvider(TranslationProvider):
         """
         if not self.enabled:
             logger.error("DeepL provider not enabled")
-            raise Exception("DeepL provider not enabled")
+            raise ProviderError("DeepL provider not enabled", permanent=True)
         
         try:
             import deepl
             
             logger.debug(f"DeepL translating: {source_lang} → {target_lang}")
             
-            translator = deepl.Translator(self.api_key)
+            # One Translator (and its connection pool) for the life of the process
+            translator = self.clients.get_sdk_client(self.client_name, self._make_translator)
             
             # Normalize language codes for DeepL
             target = self._normalize_target_lang(target_lang)
             source = self._normalize_source_lang(source_lang) if source_lang else None
             
             # DeepL API call - omit source_lang if None to let it auto-detect
-            loop = asyncio.get_event_loop()
+            # (the SDK is blocking, so it runs on the provider-io pool)
+            provider_io = get_executor("provider-io")
             if source:
-                result = await loop.run_in_executor(
-                    None,
-                    lambda: translator.translate_text(text, source_lang=source, target_lang=target)
+                result = await provider_io.run(
+                    translator.translate_text, text, source_lang=source, target_lang=target
                 )
             else:
-                result = await loop.run_in_executor(
-                    None,
-                    lambda: translator.translate_text(text, target_lang=target)
+                result = await provider_io.run(
+                    translator.translate_text, text, target_lang=target
                 )
             
             self.usage_count += 1
-            self.monthly_usage += len(text)
+            self._record_usage(len(text))
             logger.debug(f"DeepL translation successful: {target_lang}")
             return result.text
             
         except Exception as e:
             self.error_count += 1
             logger.error(f"DeepL translation failed: {str(e)}")
-            raise Exception(f"DeepL translation failed: {str(e)}")
+            raise self._classify_error(e)
+    
+    def _make_translator(self):
+        """Create the SDK client with its own retries turned off"""
+        import deepl
+        
+        # retry_async is the only retry layer: SDK retries would bypass the retry
+        # budget and Retry-After handling, and hide 429s from the concurrency limiter
+        deepl.http_client.max_network_retries = 0
+        return deepl.Translator(self.api_key)
+    
+    def _classify_error(self, e: Exception) -> ProviderError:
+        """Map DeepL client errors onto ProviderError"""
+        # deepl.DeepLException carries the HTTP status; ValueError means rejected arguments
+        status = getattr(e, "http_status_code", None)
+        return ProviderError(
+            f"DeepL translation failed: {str(e)}",
+            permanent=is_permanent_status(status) or isinstance(e, ValueError),
+            status_code=status
+        )
     
     def _normalize_source_lang(self, lang: str) -> str:
         """Normalize source language code for DeepL API"""
@@ -140,7 +405,7 @@ class DeepLProvider(TranslationProvider):
     def has_quota(self) -> bool:
         if not self.enabled:
             return False
-        return self.monthly_usage < self.monthly_limit
+        return self.quota_used() < self.monthly_limit
     
     def get_supported_languages(self) -> List[str]:
         return ['en', 'de', 'fr', 'es', 'pt', 'it', 'nl', 'pl', 'ru', 'ja', 'zh', 'ko', 'tr']
@@ -149,13 +414,14 @@ class DeepLProvider(TranslationProvider):
 class AzureTranslatorProvider(TranslationProvider):
     """Azure Translator - Most Generous Free Tier (2M chars/month)"""
     
-    def __init__(self):
-        super().__init__()
+    client_name = "azure"
+    
+    def __init__(self, clients: Optional[ProviderClientManager] = None):
+        super().__init__(clients)
         self.api_key = os.getenv("AZURE_TRANSLATOR_KEY")
         self.region = os.getenv("AZURE_TRANSLATOR_REGION", "global")
         self.endpoint = os.getenv("AZURE_TRANSLATOR_ENDPOINT", "https://api.cognitive.microsofttranslator.com")
         self.monthly_limit = 2000000
-        self.monthly_usage = 0
         
         if not self.api_key:
             logger.warning("⚠️  Azure Translator API key not found")
@@ -164,9 +430,18 @@ class AzureTranslatorProvider(TranslationProvider):
             self.enabled = True
             logger.info("✅ Azure Translator initialized (2M chars/month FREE)")
     
+    @retry_async(
+        max_retries=2,
+        strategy=RetryStrategy.DECORRELATED_JITTER,
+        base_delay=0.5,
+        max_delay=10.0,
+        exceptions=(ProviderError,),
+        retry_if=is_transient,
+        budget="azure"
+    )
     async def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         if not self.enabled:
-            raise Exception("Azure Translator not enabled")
+            raise ProviderError("Azure Translator not enabled", permanent=True)
         
         try:
             url = f"{self.endpoint}/translate"
@@ -190,21 +465,20 @@ class AzureTranslatorProvider(TranslationProvider):
             }
             body = [{'text': text}]
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, params=params, headers=headers, json=body, timeout=30.0)
-                response.raise_for_status()
-                result = response.json()
+            client = self.clients.get_client(self.client_name)
+            response = await client.post(url, params=params, headers=headers, json=body)
+            response.raise_for_status()
+            result = response.json()
             
             self.usage_count += 1
-            self.monthly_usage += len(text)
+            self._record_usage(len(text))
             return result[0]['translations'][0]['text']
         except httpx.HTTPStatusError as e:
             self.error_count += 1
-            error_detail = e.response.text if hasattr(e.response, 'text') else str(e)
-            raise Exception(f"Azure translation failed (HTTP {e.response.status_code}): {error_detail}")
+            raise _http_error("Azure translation failed", e)
         except Exception as e:
             self.error_count += 1
-            raise Exception(f"Azure translation failed: {str(e)}")
+            raise ProviderError(f"Azure translation failed: {str(e)}")
     
     def _normalize_azure_lang(self, lang: str) -> str:
         """Normalize language code for Azure API"""
@@ -219,7 +493,7 @@ class AzureTranslatorProvider(TranslationProvider):
     def has_quota(self) -> bool:
         if not self.enabled:
             return False
-        return self.monthly_usage < self.monthly_limit
+        return self.quota_used() < self.monthly_limit
     
     def get_supported_languages(self) -> List[str]:
         return ['en', 'es', 'fr', 'de', 'it', 'pt', 'ru', 'ja', 'zh', 'ko', 'ar', 'hi', 'vi', 'tr']
@@ -228,13 +502,24 @@ class AzureTranslatorProvider(TranslationProvider):
 class LibreTranslateProvider(TranslationProvider):
     """LibreTranslate - Free & Open Source (Emergency Fallback)"""
     
-    def __init__(self):
-        super().__init__()
+    client_name = "libretranslate"
+    
+    def __init__(self, clients: Optional[ProviderClientManager] = None):
+        super().__init__(clients)
         self.endpoint = os.getenv("LIBRETRANSLATE_ENDPOINT", "https://libretranslate.com")
         self.api_key = os.getenv("LIBRETRANSLATE_API_KEY", None)
         self.enabled = True
         logger.info(f"✅ LibreTranslate initialized (FREE)")
     
+    @retry_async(
+        max_retries=2,
+        strategy=RetryStrategy.DECORRELATED_JITTER,
+        base_delay=0.5,
+        max_delay=10.0,
+        exceptions=(ProviderError,),
+        retry_if=is_transient,
+        budget="libretranslate"
+    )
     async def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         try:
             url = f"{self.endpoint}/translate"
@@ -252,20 +537,19 @@ class LibreTranslateProvider(TranslationProvider):
             if self.api_key:
                 payload['api_key'] = self.api_key
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json=payload, timeout=30.0)
-                response.raise_for_status()
-                result = response.json()
+            client = self.clients.get_client(self.client_name)
+            response = await client.post(url, json=payload)
+            response.raise_for_status()
+            result = response.json()
             
             self.usage_count += 1
             return result['translatedText']
         except httpx.HTTPStatusError as e:
             self.error_count += 1
-            error_detail = e.response.text if hasattr(e.response, 'text') else str(e)
-            raise Exception(f"LibreTranslate failed (HTTP {e.response.status_code}): {error_detail}")
+            raise _http_error("LibreTranslate failed", e)
         except Exception as e:
             self.error_count += 1
-            raise Exception(f"LibreTranslate failed: {str(e)}")
+            raise ProviderError(f"LibreTranslate failed: {str(e)}")
     
     def has_quota(self) -> bool:
         return True
@@ -275,11 +559,70 @@ class LibreTranslateProvider(TranslationProvider):
 
 
 class MultiProviderTranslationService:
-    """Unified translation service with automatic fallback"""
+    """Unified translation service with scored provider routing and fallback"""
     
     def __init__(self):
-        self.providers = [DeepLProvider(), AzureTranslatorProvider(), LibreTranslateProvider()]
-        self.enabled_providers = [p for p in self.providers if p.has_quota()]
+        self.clients = ProviderClientManager()
+        self.providers = [
+            DeepLProvider(self.clients),
+            AzureTranslatorProvider(self.clients),
+            LibreTranslateProvider(self.clients)
+        ]
+        self.router = ProviderRouter()
+        configure_circuit_breakers(get_config_loader().get_config().get("providers", {}).get("circuit_breaker", {}))
+        # Adaptive per-provider concurrency, shared by every request in the process
+        config = get_config_loader().get_config()
+        concurrency_config = config.get("providers", {}).get("concurrency", {})
+        initial_limit = int(config.get("roma", {}).get("executor", {}).get("max_concurrent", 5))
+        self.limiters = {
+            provider.name: AdaptiveLimiter(
+                initial=initial_limit,
+                min_limit=int(concurrency_config.get("min_limit", 1)),
+                max_limit=int(concurrency_config.get("max_limit", 32)),
+                backoff=float(concurrency_config.get("backoff", 0.5)),
+                latency_tolerance=float(concurrency_config.get("latency_tolerance", 2.0))
+            )
+            for provider in self.providers
+        }
+        
+        # Per-provider character rate (chars/second), from each provider's documented throughput
+        char_rate_config = config.get("providers", {}).get("char_rate", {})
+        self.char_rate_max_wait = float(char_rate_config.get("max_wait", 2.0))
+        self.char_buckets: Dict[str, TokenBucket] = {}
+        if char_rate_config.get("enabled", True):
+            for provider in self.providers:
+                provider_rate = char_rate_config.get(provider.client_name)
+                if provider_rate:
+                    rate = float(provider_rate["chars_per_second"])
+                    self.char_buckets[provider.name] = TokenBucket(
+                        rate=rate,
+                        capacity=float(provider_rate.get("burst", rate))
+                    )
+        
+        # Monthly usage shared by all processes
+        self.quota_ledger = QuotaLedger.from_config()
+        for provider in self.providers:
+            provider.ledger = self.quota_ledger
+        
+        configure_retry_budgets(
+            get_config_loader().get_config().get("providers", {}).get("retry_budget", {}),
+            [provider.client_name for provider in self.providers]
+        )
+        
+        negative_config = get_config_loader().get_config().get("providers", {}).get("negative_cache", {})
+        self.negative_cache = NegativeCache(
+            ttl=int(negative_config.get("ttl_seconds", 3600)),
+            max_entries=int(negative_config.get("max_entries", 1000))
+        )
+        
+        hedging_config = get_config_loader().get_config().get("providers", {}).get("hedging", {})
+        self.hedging = HedgePolicy(
+            enabled=bool(hedging_config.get("enabled", False)),
+            percentile=float(hedging_config.get("percentile", 0.9)),
+            budget_ratio=float(hedging_config.get("budget_ratio", 0.05)),
+            min_samples=int(hedging_config.get("min_samples", 20)),
+            min_delay=float(hedging_config.get("min_delay_ms", 50)) / 1000
+        )
         
         if not self.enabled_providers:
             logger.warning("⚠️  No translation providers enabled!")
@@ -288,30 +631,200 @@ class MultiProviderTranslationService:
             for i, provider in enumerate(self.enabled_providers, 1):
                 logger.info(f"   {i}. {provider.name}")
     
-    async def translate(self, text: str, source_lang: str, target_lang: str) -> Dict[str, any]:
-        """Translate text with automatic provider fallback"""
-        last_error = None
+    @property
+    def enabled_providers(self) -> List[TranslationProvider]:
+        """Providers with quota left, re-evaluated so exhausted ones come back when quota returns"""
+        return [p for p in self.providers if p.has_quota()]
+    
+    def _quota_pressure(self) -> Dict[str, float]:
+        """Per-provider pressure (0-1) from the month-end usage forecast"""
+        if self.quota_ledger is None:
+            return {}
+        return {
+            provider.name: self.quota_ledger.forecast(provider.client_name, provider.monthly_limit)["pressure"]
+            for provider in self.providers
+            if hasattr(provider, "monthly_limit")
+        }
+    
+    def get_quota_stats(self) -> Dict:
+        """Shared usage and exhaustion forecast per provider"""
+        if self.quota_ledger is None:
+            return {"ledger": False}
+        return {
+            "ledger": True,
+            **self.quota_ledger.get_stats(),
+            "forecast": {
+                provider.name: self.quota_ledger.forecast(provider.client_name, provider.monthly_limit)
+                for provider in self.providers
+                if hasattr(provider, "monthly_limit")
+            }
+        }
+    
+    async def start(self):
+        """Open pooled provider connections and the quota ledger at process startup"""
+        if self.quota_ledger is not None:
+            try:
+                await self.quota_ledger.start()
+            except Exception as e:
+                logger.warning(f"⚠️  Quota ledger unavailable, counting usage per process: {e}")
+                self.quota_ledger = None
+                for provider in self.providers:
+                    provider.ledger = None
         
-        for provider in self.enabled_providers:
+        await self.clients.start([
+            provider.client_name for provider in self.enabled_providers
+            if not isinstance(provider, DeepLProvider)
+        ])
+    
+    async def aclose(self):
+        """Close pooled provider connections and flush the quota ledger"""
+        await self.clients.aclose()
+        if self.quota_ledger is not None:
+            await self.quota_ledger.close()
+    
+    def _candidates(self, source_lang: str, target_lang: str) -> Iterator[TranslationProvider]:
+        """Providers to try for a pair, best routing score first"""
+        ranked = self.router.rank(
+            self.enabled_providers, source_lang, target_lang, quota_pressure=self._quota_pressure()
+        )
+        for provider in ranked:
             if not provider.has_quota():
                 logger.warning(f"⚠️  {provider.name} quota exceeded, trying next provider...")
                 continue
             
-            try:
-                translation = await provider.translate(text, source_lang, target_lang)
-                return {
-                    'translation': translation,
-                    'provider': provider.name,
-                    'source_lang': source_lang,
-                    'target_lang': target_lang,
-                    'success': True
-                }
-            except Exception as e:
-                last_error = e
-                logger.warning(f"⚠️  {provider.name} failed: {str(e)}")
-                logger.info("Trying next provider...")
+            if self.negative_cache.is_blocked(provider.name, source_lang, target_lang):
+                logger.debug(f"Skipping {provider.name} for {source_lang}->{target_lang} (known permanent failure)")
                 continue
+            
+            if not provider.supports(target_lang):
+                self.negative_cache.add(provider.name, source_lang, target_lang, "unsupported language")
+                continue
+            
+            # Checked last: a half-open breaker hands out its single probe here
+            if not get_circuit_breaker(provider.client_name).allow_request():
+                logger.debug(f"Skipping {provider.name} (circuit open)")
+                continue
+            
+            yield provider
+    
+    async def _attempt(self, provider: TranslationProvider, text: str, source_lang: str, target_lang: str) -> str:
+        """
+        Call one provider within its concurrency limit, reporting the outcome
+        to the limiter, its circuit breaker and the router
+        """
+        breaker = get_circuit_breaker(provider.client_name)
+        limiter = self.limiters[provider.name]
+        char_bucket = self.char_buckets.get(provider.name)
+        try:
+            # Queue briefly to stay under the provider's character rate instead of getting a 429
+            if char_bucket is not None:
+                await char_bucket.acquire(len(text), max_wait=self.char_rate_max_wait)
+            start = await limiter.acquire()
+        except asyncio.TimeoutError:
+            breaker.release()
+            raise ProviderError(f"{provider.name} character rate exceeded (queue wait over {self.char_rate_max_wait}s)")
+        except asyncio.CancelledError:
+            breaker.release()
+            raise
+        
+        try:
+            translation = await provider.translate(text, source_lang, target_lang)
+        except asyncio.CancelledError:
+            # Lost a hedge race: it took at least this long
+            latency = time.monotonic() - start
+            limiter.release(start, success=False)
+            breaker.release()
+            self.hedging.record(provider.name, source_lang, target_lang, latency)
+            self.router.record(provider.name, source_lang, target_lang, latency, None)
+            raise
+        except Exception as e:
+            limiter.release(start, success=False, overloaded=is_overload(e))
+            # A permanent error is a per-pair problem from a provider that answered
+            if is_transient(e):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            self.router.record(provider.name, source_lang, target_lang, time.monotonic() - start, False)
+            raise
+        limiter.release(start)
+        breaker.record_success()
+        latency = time.monotonic() - start
+        self.hedging.record(provider.name, source_lang, target_lang, latency)
+        self.router.record(provider.name, source_lang, target_lang, latency, True)
+        return translation
+    
+    async def translate(self, text: str, source_lang: str, target_lang: str) -> Dict[str, any]:
+        """
+        Translate text with automatic provider fallback
+        
+        With hedging enabled, a primary that is slower than its usual latency
+        for the pair gets a parallel request to the next provider; the first
+        success wins and the other call is cancelled.
+        """
+        candidates = self._candidates(source_lang, target_lang)
+        pending: Dict[asyncio.Task, TranslationProvider] = {}
+        hedged = False
+        hedge_task: Optional[asyncio.Task] = None
+        last_error = None
+        self.hedging.requests += 1
+        
+        try:
+            while True:
+                if not pending:
+                    provider = next(candidates, None)
+                    if provider is None:
+                        break
+                    task = asyncio.create_task(self._attempt(provider, text, source_lang, target_lang))
+                    pending[task] = provider
+                
+                delay = None
+                if not hedged:
+                    delay = self.hedging.delay_for(next(iter(pending.values())).name, source_lang, target_lang)
+                
+                done, _ = await asyncio.wait(pending, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+                
+                if not done:
+                    # Primary is slower than usual for this pair: hedge once
+                    hedged = True
+                    if self.hedging.try_acquire():
+                        provider = next(candidates, None)
+                        if provider is not None:
+                            logger.debug(f"Hedging {source_lang}->{target_lang} with {provider.name}")
+                            hedge_task = asyncio.create_task(self._attempt(provider, text, source_lang, target_lang))
+                            pending[hedge_task] = provider
+                    continue
+                
+                for task in done:
+                    provider = pending.pop(task)
+                    try:
+                        translation = task.result()
+                    except Exception as e:
+                        last_error = e
+                        if not is_transient(e):
+                            self.negative_cache.add(provider.name, source_lang, target_lang, str(e))
+                        logger.warning(f"⚠️  {provider.name} failed: {str(e)}")
+                        if not pending:
+                            logger.info("Trying next provider...")
+                        continue
+                    
+                    if task is hedge_task:
+                        self.hedging.hedge_wins += 1
+                    return {
+                        'translation': translation,
+                        'provider': provider.name,
+                        'source_lang': source_lang,
+                        'target_lang': target_lang,
+                        'success': True
+                    }
+        finally:
+            for task in pending:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # Loser finished in the same round; don't leave it unretrieved
         
+        if last_error is None:
+            raise Exception(f"No translation provider available for {source_lang}->{target_lang}")
         raise Exception(f"All translation providers failed. Last error: {last_error}")
     
     def get_stats(self) -> Dict:
@@ -321,6 +834,9 @@ class MultiProviderTranslationService:
             stats[provider.name] = {
                 'enabled': provider.has_quota(),
                 'usage_count': provider.usage_count,
-                'error_count': provider.error_count
+                'error_count': provider.error_count,
+                'circuit': get_circuit_breaker(provider.client_name).state.value,
+                'concurrency_limit': self.limiters[provider.name].get_stats()['limit'],
+                'negatively_cached_pairs': self.negative_cache.count_for(provider.name)
             }
         return stats
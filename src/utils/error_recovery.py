@@ -6,11 +6,14 @@ for reliable error handling and provider failover.
 """
 
 import asyncio
+import random
 import time
 from typing import Callable, Any, Dict, Optional
+from collections import deque
 from functools import wraps
 from enum import Enum
 from ..utils.logger import get_logger
+from ..utils.rate_limit import TokenBucket
 
 logger = get_logger(__name__)
 
@@ -20,6 +23,7 @@ class RetryStrategy(Enum):
     EXPONENTIAL = "exponential"
     LINEAR = "linear"
     FIXED = "fixed"
+    DECORRELATED_JITTER = "decorrelated_jitter"
 
 
 class CircuitBreakerState(Enum):
@@ -34,13 +38,15 @@ class CircuitBreaker:
     Circuit Breaker Pattern Implementation
     
     Prevents cascading failures by stopping requests to failing services.
+    While half-open, a single probe request is let through at a time.
     """
     
     def __init__(
         self,
         failure_threshold: int = 5,
         recovery_timeout: int = 60,
-        success_threshold: int = 2
+        success_threshold: int = 2,
+        name: str = ""
     ):
         """
         Initialize circuit breaker
@@ -49,15 +55,60 @@ class CircuitBreaker:
             failure_threshold: Number of failures before opening circuit
             recovery_timeout: Seconds before attempting recovery
             success_threshold: Successes needed to close circuit
+            name: Protected service name (for logs)
         """
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.success_threshold = success_threshold
+        self.name = name
         
         self.state = CircuitBreakerState.CLOSED
         self.failure_count = 0
         self.success_count = 0
         self.last_failure_time: Optional[float] = None
+        self.probe_in_flight = False
+        self.rejected_count = 0
+        self.transitions: deque = deque(maxlen=20)
+    
+    def _transition(self, state: CircuitBreakerState):
+        """Change state, remembering the transition"""
+        if state == self.state:
+            return
+        self.transitions.append({
+            "from": self.state.value,
+            "to": state.value,
+            "at": time.time()
+        })
+        self.state = state
+        self.success_count = 0
+    
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may go through
+        
+        While open, requests are rejected without waiting. Once the recovery
+        timeout passes the breaker goes half-open and the caller that gets
+        True is the probe; other callers are rejected until it reports back.
+        """
+        if self.state == CircuitBreakerState.CLOSED:
+            return True
+        
+        if self.state == CircuitBreakerState.OPEN:
+            if time.time() - self.last_failure_time < self.recovery_timeout:
+                self.rejected_count += 1
+                return False
+            logger.info(f"Circuit breaker for {self.name} attempting recovery")
+            self._transition(CircuitBreakerState.HALF_OPEN)
+        
+        if self.probe_in_flight:
+            self.rejected_count += 1
+            return False
+        self.probe_in_flight = True
+        return True
+    
+    def release(self):
+        """Give up an allowed request without an outcome (e.g. cancelled)"""
+        self.probe_in_flight = False
         
     async def call(
         self,
@@ -79,48 +130,113 @@ class CircuitBreaker:
         Raises:
             Exception: If circuit is open or function fails
         """
-        if self.state == CircuitBreakerState.OPEN:
-            # Check if recovery timeout has passed
-            if time.time() - self.last_failure_time > self.recovery_timeout:
-                logger.info(f"Circuit breaker for {func.__name__} attempting recovery")
-                self.state = CircuitBreakerState.HALF_OPEN
-                self.success_count = 0
-            else:
-                raise Exception(
-                    f"Circuit breaker OPEN for {func.__name__}. "
-                    f"Service unavailable. Retry in {self.recovery_timeout}s"
-                )
+        if not self.allow_request():
+            raise Exception(
+                f"Circuit breaker OPEN for {func.__name__}. "
+                f"Service unavailable. Retry in {self.recovery_timeout}s"
+            )
         
         try:
             result = await func(*args, **kwargs)
-            self._on_success()
-            return result
-        except Exception as e:
-            self._on_failure()
+        except asyncio.CancelledError:
+            self.release()
+            raise
+        except Exception:
+            self.record_failure()
             raise
+        self.record_success()
+        return result
     
-    def _on_success(self):
+    def record_success(self):
         """Handle successful call"""
         self.failure_count = 0
+        self.probe_in_flight = False
         
         if self.state == CircuitBreakerState.HALF_OPEN:
             self.success_count += 1
             if self.success_count >= self.success_threshold:
-                logger.info("Circuit breaker CLOSED - service recovered")
-                self.state = CircuitBreakerState.CLOSED
-                self.success_count = 0
+                logger.info(f"Circuit breaker for {self.name} CLOSED - service recovered")
+                self._transition(CircuitBreakerState.CLOSED)
     
-    def _on_failure(self):
+    def record_failure(self):
         """Handle failed call"""
         self.failure_count += 1
         self.last_failure_time = time.time()
+        self.probe_in_flight = False
         
-        if self.failure_count >= self.failure_threshold:
-            logger.warning(
-                f"Circuit breaker OPEN after {self.failure_count} failures"
-            )
-            self.state = CircuitBreakerState.OPEN
-            self.success_count = 0
+        if self.state == CircuitBreakerState.HALF_OPEN or self.failure_count >= self.failure_threshold:
+            if self.state != CircuitBreakerState.OPEN:
+                logger.warning(
+                    f"Circuit breaker for {self.name} OPEN after {self.failure_count} failures"
+                )
+            self._transition(CircuitBreakerState.OPEN)
+    
+    def reset(self):
+        """Close the breaker and clear counters"""
+        self._transition(CircuitBreakerState.CLOSED)
+        self.failure_count = 0
+        self.probe_in_flight = False
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get breaker state and recent transitions"""
+        retry_in = 0
+        if self.state == CircuitBreakerState.OPEN:
+            retry_in = max(0, int(self.recovery_timeout - (time.time() - self.last_failure_time)))
+        
+        return {
+            "state": self.state.value,
+            "failure_count": self.failure_count,
+            "rejected": self.rejected_count,
+            "probe_in_flight": self.probe_in_flight,
+            "retry_in": retry_in,
+            "transitions": list(self.transitions)
+        }
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of successful traffic
+    
+    Every success deposits `ratio` tokens and every retry spends one, so during
+    an outage retries stop once the budget is drained instead of multiplying
+    load. A small time-based trickle (min_per_second) keeps low-traffic
+    services able to retry at all.
+    """
+    
+    def __init__(self, ratio: float = 0.1, min_per_second: float = 1.0, capacity: float = 10):
+        """
+        Initialize retry budget
+        
+        Args:
+            ratio: Retries allowed per successful call
+            min_per_second: Retries allowed per second regardless of traffic
+            capacity: Maximum banked retries
+        """
+        self.ratio = ratio
+        self.bucket = TokenBucket(rate=min_per_second, capacity=capacity)
+        self.retries = 0
+        self.suppressed: Dict[str, int] = {"budget": 0, "retry_after": 0}
+    
+    def record_success(self):
+        """Earn retry tokens from a successful call"""
+        self.bucket.deposit(self.ratio)
+    
+    def try_spend(self) -> bool:
+        """Take a retry from the budget"""
+        if self.bucket.try_acquire():
+            self.retries += 1
+            return True
+        self.suppressed["budget"] += 1
+        return False
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get retry budget statistics"""
+        return {
+            "ratio": self.ratio,
+            "tokens": round(self.bucket.tokens, 2),
+            "retries": self.retries,
+            "suppressed": dict(self.suppressed)
+        }
 
 
 def retry_async(
@@ -130,19 +246,27 @@ def retry_async(
     max_delay: float = 60.0,
     backoff_factor: float = 2.0,
     exceptions: tuple = (Exception,),
-    on_retry: Optional[Callable] = None
+    on_retry: Optional[Callable] = None,
+    retry_if: Optional[Callable[[BaseException], bool]] = None,
+    budget: Optional[str] = None
 ):
     """
     Async retry decorator with exponential backoff
     
+    Errors carrying a retry_after (seconds, e.g. from a Retry-After header)
+    wait at least that long; if it exceeds max_delay the error is raised
+    instead so callers can fall back elsewhere.
+    
     Args:
         max_retries: Maximum number of retries
-        strategy: Retry strategy (exponential, linear, fixed)
+        strategy: Retry strategy (exponential, linear, fixed, decorrelated jitter)
         base_delay: Initial delay between retries
         max_delay: Maximum delay between retries
         backoff_factor: Multiplier for exponential backoff
         exceptions: Tuple of exceptions to catch
         on_retry: Callback on retry
+        retry_if: Predicate on the caught exception; errors it rejects are raised immediately
+        budget: Name of a shared RetryBudget that retries are drawn from
     
     Example:
         @retry_async(max_retries=3)
@@ -153,13 +277,21 @@ def retry_async(
         @wraps(func)
         async def wrapper(*args, **kwargs):
             last_exception = None
+            retry_budget = get_retry_budget(budget) if budget else None
+            delay = base_delay
             
             for attempt in range(max_retries + 1):
                 try:
-                    return await func(*args, **kwargs)
+                    result = await func(*args, **kwargs)
+                    if retry_budget is not None:
+                        retry_budget.record_success()
+                    return result
                 except exceptions as e:
                     last_exception = e
                     
+                    if retry_if is not None and not retry_if(e):
+                        raise
+                    
                     if attempt < max_retries:
                         # Calculate delay
                         if strategy == RetryStrategy.EXPONENTIAL:
@@ -172,9 +304,27 @@ def retry_async(
                                 base_delay * (attempt + 1),
                                 max_delay
                             )
+                        elif strategy == RetryStrategy.DECORRELATED_JITTER:
+                            delay = min(random.uniform(base_delay, delay * 3), max_delay)
                         else:  # FIXED
                             delay = base_delay
                         
+                        retry_after = getattr(e, "retry_after", None)
+                        if retry_after is not None:
+                            if retry_after > max_delay:
+                                if retry_budget is not None:
+                                    retry_budget.suppressed["retry_after"] += 1
+                                logger.warning(
+                                    f"{func.__name__} failed: {str(e)}. "
+                                    f"Retry-After {retry_after:.0f}s exceeds {max_delay:.0f}s, not retrying"
+                                )
+                                raise
+                            delay = max(delay, retry_after)
+                        
+                        if retry_budget is not None and not retry_budget.try_spend():
+                            logger.warning(f"{func.__name__} failed: {str(e)}. Retry budget exhausted, not retrying")
+                            raise
+                        
                         logger.warning(
                             f"{func.__name__} attempt {attempt + 1}/{max_retries + 1} failed: {str(e)}. "
                             f"Retrying in {delay:.1f}s"
@@ -287,23 +437,60 @@ class RetryableOperation:
 
 # Predefined circuit breakers for translation providers
 translation_circuit_breakers: Dict[str, CircuitBreaker] = {
-    "deepl": CircuitBreaker(failure_threshold=5, recovery_timeout=60),
-    "azure": CircuitBreaker(failure_threshold=5, recovery_timeout=60),
-    "libretranslate": CircuitBreaker(failure_threshold=5, recovery_timeout=60),
+    "deepl": CircuitBreaker(failure_threshold=5, recovery_timeout=60, name="deepl"),
+    "azure": CircuitBreaker(failure_threshold=5, recovery_timeout=60, name="azure"),
+    "libretranslate": CircuitBreaker(failure_threshold=5, recovery_timeout=60, name="libretranslate"),
 }
 
 
 def get_circuit_breaker(provider_name: str) -> CircuitBreaker:
     """Get or create circuit breaker for provider"""
     if provider_name not in translation_circuit_breakers:
-        translation_circuit_breakers[provider_name] = CircuitBreaker()
+        translation_circuit_breakers[provider_name] = CircuitBreaker(name=provider_name)
     return translation_circuit_breakers[provider_name]
 
 
+def configure_circuit_breakers(breaker_config: Dict[str, Any]):
+    """Apply the providers.circuit_breaker config section to all provider breakers"""
+    for breaker in translation_circuit_breakers.values():
+        breaker.failure_threshold = int(breaker_config.get("failure_threshold", breaker.failure_threshold))
+        breaker.recovery_timeout = int(breaker_config.get("recovery_timeout", breaker.recovery_timeout))
+        breaker.success_threshold = int(breaker_config.get("success_threshold", breaker.success_threshold))
+
+
+def get_circuit_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """State of every provider circuit breaker"""
+    return {name: breaker.get_stats() for name, breaker in translation_circuit_breakers.items()}
+
+
+# Retry budgets shared by every call to a provider in this process
+retry_budgets: Dict[str, RetryBudget] = {}
+
+
+def get_retry_budget(name: str) -> RetryBudget:
+    """Get or create a named retry budget"""
+    if name not in retry_budgets:
+        retry_budgets[name] = RetryBudget()
+    return retry_budgets[name]
+
+
+def configure_retry_budgets(budget_config: Dict[str, Any], names):
+    """Create the named retry budgets from the providers.retry_budget config section"""
+    for name in names:
+        retry_budgets[name] = RetryBudget(
+            ratio=float(budget_config.get("ratio", 0.1)),
+            min_per_second=float(budget_config.get("min_per_second", 1.0)),
+            capacity=float(budget_config.get("capacity", 10))
+        )
+
+
+def get_retry_budget_stats() -> Dict[str, Dict[str, Any]]:
+    """Statistics for every retry budget"""
+    return {name: budget.get_stats() for name, budget in retry_budgets.items()}
+
+
 async def reset_circuit_breakers():
     """Reset all circuit breakers (useful for recovery)"""
     for breaker in translation_circuit_breakers.values():
-        breaker.state = CircuitBreakerState.CLOSED
-        breaker.failure_count = 0
-        breaker.success_count = 0
+        breaker.reset()
     logger.info("All circuit breakers reset")
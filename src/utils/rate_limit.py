@@ -0,0 +1,232 @@
+"""
+Rate Limiting
+
+Token bucket used to pace background work against upstream providers, and an
+adaptive (AIMD) concurrency limiter for provider calls.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+
+class TokenBucket:
+    """
+    Classic token bucket: refills at `rate` tokens per second up to `capacity`
+
+    try_acquire() never waits; acquire() queues the caller until tokens are
+    available and records how long it waited.
+
+    Not thread-safe; meant to be used from a single event loop.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize token bucket
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens (burst size); the bucket starts full
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+        self.waits = 0
+        self.total_wait = 0.0
+        self.max_wait_seen = 0.0
+        self.rejected = 0
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available"""
+        self._refill()
+        return self._tokens
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """Take tokens if available, without waiting"""
+        self._refill()
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return True
+        return False
+
+    async def acquire(self, tokens: float = 1, max_wait: Optional[float] = None) -> float:
+        """
+        Take tokens, sleeping until the bucket can cover them
+
+        Tokens are reserved up front (the balance may go negative), so callers
+        are served in arrival order. A request larger than capacity only waits
+        for a full bucket; the excess becomes debt that later callers wait off.
+
+        Args:
+            tokens: Tokens to take
+            max_wait: Give up without taking anything if the wait would be longer
+
+        Returns:
+            Seconds waited
+
+        Raises:
+            asyncio.TimeoutError: If the wait would exceed max_wait
+        """
+        self._refill()
+        needed = min(tokens, self.capacity)
+        wait = (needed - self._tokens) / self.rate if self._tokens < needed else 0.0
+        if max_wait is not None and wait > max_wait:
+            self.rejected += 1
+            raise asyncio.TimeoutError(f"token bucket wait {wait:.2f}s exceeds {max_wait:.2f}s")
+
+        self._tokens -= tokens
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._tokens += tokens
+                raise
+            self.waits += 1
+            self.total_wait += wait
+            self.max_wait_seen = max(self.max_wait_seen, wait)
+        return wait
+
+    def deposit(self, tokens: float):
+        """Add tokens outside the time-based refill (still capped at capacity)"""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + tokens)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get bucket state"""
+        return {
+            "rate": self.rate,
+            "capacity": self.capacity,
+            "tokens": round(self.tokens, 2),
+            "waits": self.waits,
+            "avg_wait_ms": round(self.total_wait / self.waits * 1000, 1) if self.waits else 0,
+            "max_wait_ms": round(self.max_wait_seen * 1000, 1),
+            "rejected": self.rejected
+        }
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limiter
+
+    The limit grows by about one slot per limit's worth of successful calls
+    while latency stays within latency_tolerance x the baseline, and is cut
+    by `backoff` on overload (429s, timeouts). Only calls started after the
+    last cut can cut again, so one burst of 429s halves the limit once.
+
+    Not thread-safe; meant to be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0
+    ):
+        """
+        Initialize limiter
+
+        Args:
+            initial: Starting concurrency limit
+            min_limit: Lowest the limit can be cut to
+            max_limit: Highest the limit can grow to
+            backoff: Multiplier applied to the limit on overload
+            latency_tolerance: Latency above baseline x this stops growth
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.limit = float(min(max(initial, min_limit), max_limit))
+
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._waiters: deque = deque()
+        self._baseline: float = 0.0
+        self._last_decrease = 0.0
+        self.increases = 0
+        self.decreases = 0
+
+    async def acquire(self) -> float:
+        """Wait for a slot; returns the start time to pass to release()"""
+        if self.in_flight >= int(self.limit) or self._waiters:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif not waiter.cancelled():
+                    # Slot was handed to us just as we were cancelled: pass it on
+                    self.in_flight -= 1
+                    self._wake()
+                raise
+        else:
+            self.in_flight += 1
+
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        return time.monotonic()
+
+    def release(self, started: float, success: bool = True, overloaded: bool = False):
+        """
+        Return a slot and adapt the limit
+
+        Args:
+            started: Value returned by acquire()
+            success: Whether the call succeeded (failures other than overload don't adapt)
+            overloaded: Upstream signalled overload (429, timeout)
+        """
+        self.in_flight -= 1
+        latency = time.monotonic() - started
+
+        if overloaded:
+            if started >= self._last_decrease:
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+                self._last_decrease = time.monotonic()
+                self.decreases += 1
+        elif success:
+            if not self._baseline:
+                self._baseline = latency
+            else:
+                # Slowly tracking baseline; it drifts down faster than up
+                weight = 0.2 if latency < self._baseline else 0.01
+                self._baseline += weight * (latency - self._baseline)
+
+            if latency <= self._baseline * self.latency_tolerance and self.limit < self.max_limit:
+                previous = int(self.limit)
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+                if int(self.limit) > previous:
+                    self.increases += 1
+
+        self._wake()
+
+    def _wake(self):
+        """Hand free slots to waiters"""
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter state"""
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "peak_in_flight": self.peak_in_flight,
+            "baseline_latency_ms": round(self._baseline * 1000, 1),
+            "increases": self.increases,
+            "decreases": self.decreases
+        }
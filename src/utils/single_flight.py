@@ -0,0 +1,108 @@
+"""
+Single-Flight Request Coalescing
+
+Ensures that concurrent identical operations share one in-flight call
+instead of each hitting the upstream service.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class _InFlightCall:
+    """A shared in-flight call and the number of callers awaiting it"""
+    
+    __slots__ = ("task", "waiters")
+    
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Process-wide registry of in-flight calls keyed by a request fingerprint
+    
+    The first caller for a key starts the call; callers arriving while it is
+    still running await the same future. Results and exceptions are delivered
+    to every waiter. If all waiters are cancelled, the shared call is cancelled.
+    """
+    
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, _InFlightCall] = {}
+        self.executed = 0
+        self.coalesced = 0
+    
+    async def do(
+        self,
+        key: Hashable,
+        func: Callable[..., Awaitable[Any]],
+        *args,
+        **kwargs
+    ) -> Any:
+        """
+        Run func once per key among concurrent callers
+        
+        Args:
+            key: Request fingerprint
+            func: Async function to execute
+            *args: Function arguments
+            **kwargs: Function keyword arguments
+        
+        Returns:
+            Function result (shared between all concurrent callers)
+        """
+        call = self._calls.get(key)
+        
+        if call is None:
+            call = _InFlightCall(asyncio.ensure_future(func(*args, **kwargs)))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _, key=key, call=call: self._forget(key, call))
+            self.executed += 1
+        else:
+            self.coalesced += 1
+            logger.debug(f"{self.name}: joined in-flight call ({call.waiters} waiting)")
+        
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Last waiter went away - nobody needs the result anymore. Forget
+                # it now so a caller arriving before the task unwinds starts afresh
+                call.task.cancel()
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+    
+    def _forget(self, key: Hashable, call: _InFlightCall):
+        """Remove a finished call from the registry"""
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        
+        # Mark the exception as retrieved when every waiter was cancelled
+        if not call.task.cancelled() and call.waiters == 0:
+            call.task.exception()
+    
+    def in_flight(self) -> int:
+        """Number of calls currently in flight"""
+        return len(self._calls)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics"""
+        total = self.executed + self.coalesced
+        return {
+            "name": self.name,
+            "in_flight": len(self._calls),
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "coalesce_rate": self.coalesced / total if total > 0 else 0
+        }
+
+
+# Process-wide registry for provider translation calls
+translation_flights = SingleFlight("translation")
@@ -0,0 +1,132 @@
+"""
+Named Thread Pools
+
+Separately sized thread pools for blocking SDK calls, so one workload can't
+exhaust the threads another one needs (e.g. 30-second Whisper uploads
+starving DeepL calls on the shared default executor).
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+from ..core.config_loader import get_config_loader
+from ..utils.logger import get_logger
+
+logger = get_logger("thread_pools")
+
+# Pool sizes used when agent_config.yaml has no executors section
+DEFAULT_POOL_SIZES = {
+    "provider-io": 8,
+    "asr-io": 2,
+}
+
+
+class BoundedExecutor:
+    """
+    Named thread pool with queue-depth and wait-time metrics
+
+    Wait time is how long a call sat in the queue before a worker picked it up.
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+
+        self.submitted = 0
+        self.started = 0
+        self.completed = 0
+        self.failed = 0
+        self.max_wait = 0.0
+        self._waits = deque(maxlen=512)
+
+    def _call(self, submitted_at: float, func: Callable, *args, **kwargs) -> Any:
+        """Run func on a worker thread, recording queue wait"""
+        wait = time.monotonic() - submitted_at
+        with self._lock:
+            self.started += 1
+            self._waits.append(wait)
+            if wait > self.max_wait:
+                self.max_wait = wait
+
+        try:
+            return func(*args, **kwargs)
+        except BaseException:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            with self._lock:
+                self.completed += 1
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking function on this pool
+
+        Args:
+            func: Blocking callable
+            *args: Function arguments
+            **kwargs: Function keyword arguments
+
+        Returns:
+            Function result
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self.submitted += 1
+
+        call = functools.partial(self._call, time.monotonic(), func, *args, **kwargs)
+        return await loop.run_in_executor(self._pool, call)
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting work and release the threads"""
+        self._pool.shutdown(wait=wait)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics"""
+        with self._lock:
+            waits = sorted(self._waits)
+            queue_depth = self.submitted - self.started
+            active = self.started - self.completed
+
+            return {
+                "max_workers": self.max_workers,
+                "queue_depth": queue_depth,
+                "active": active,
+                "completed": self.completed,
+                "failed": self.failed,
+                "wait_ms": {
+                    "p50": waits[len(waits) // 2] * 1000 if waits else 0,
+                    "p95": waits[int(len(waits) * 0.95)] * 1000 if waits else 0,
+                    "max": self.max_wait * 1000
+                }
+            }
+
+
+_executors: Dict[str, BoundedExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(name: str) -> BoundedExecutor:
+    """Get or create a named executor sized from the executors config section"""
+    executor = _executors.get(name)
+    if executor is not None:
+        return executor
+
+    with _executors_lock:
+        if name not in _executors:
+            executors_config = get_config_loader().get_config().get("executors", {})
+            size = executors_config.get(name, {}).get("max_workers", DEFAULT_POOL_SIZES.get(name, 4))
+            _executors[name] = BoundedExecutor(name, int(size))
+            logger.info(f"✅ Thread pool '{name}' ready ({size} workers)")
+        return _executors[name]
+
+
+def get_executor_stats() -> Dict[str, Dict[str, Any]]:
+    """Statistics for every named executor created so far"""
+    return {name: executor.get_stats() for name, executor in _executors.items()}
@@ -4,9 +4,14 @@ Validators
 Input validation utilities
 """
 
+import sys
+from functools import lru_cache
 from typing import List, Optional
 from ..core.config_loader import get_config_loader
 
+# Metrics label for language codes outside languages.yaml
+OTHER_LANGUAGE = "other"
+
 
 def validate_text_length(text: str, max_length: Optional[int] = None) -> bool:
     """
@@ -61,3 +66,29 @@ def validate_target_languages_count(languages: List[str]) -> bool:
     
     return len(languages) <= max_langs
 
+
+@lru_cache(maxsize=256)
+def stats_language(lang: Optional[str]) -> str:
+    """
+    Language code to key per-pair metrics by
+    
+    Codes come from clients, so anything not in languages.yaml is grouped
+    under "other" instead of growing stats maps without bound.
+    
+    Args:
+        lang: Language code (None or "auto" for auto-detect)
+    
+    Returns:
+        Lowercase supported code, "auto" or "other"
+    """
+    if not lang or lang == "auto":
+        return "auto"
+    
+    code = lang.lower()
+    return code if code in get_config_loader().get_languages() else OTHER_LANGUAGE
+
+
+@lru_cache(maxsize=1024)
+def language_pair(source_lang: Optional[str], target_lang: str) -> str:
+    """Interned "source->target" label for per-pair metrics (see stats_language)"""
+    return sys.intern(f"{stats_language(source_lang)}->{stats_language(target_lang)}")
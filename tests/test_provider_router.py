@@ -0,0 +1,53 @@
+"""Tests for provider ranking under quota pressure"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.services import quota_ledger
+from src.services.provider_router import ProviderRouter
+from src.services.quota_ledger import QuotaLedger
+
+DEEPL = SimpleNamespace(name="DeepLProvider", client_name="deepl")
+AZURE = SimpleNamespace(name="AzureTranslatorProvider", client_name="azure")
+LIBRE = SimpleNamespace(name="LibreTranslateProvider", client_name="libretranslate")
+
+
+@pytest.fixture
+def mid_month(monkeypatch):
+    monkeypatch.setattr(quota_ledger, "seconds_left_in_month", lambda now=None: 15 * 86400)
+
+
+async def test_burst_does_not_route_below_the_fallback(tmp_path, mid_month):
+    ledger = QuotaLedger(str(tmp_path / "usage.db"))
+    await ledger.flush()
+
+    # A few thousand characters in a burst, with most of the quota left
+    ledger.record("deepl", 5000)
+    await ledger.flush()
+    forecast = ledger.forecast("deepl", 500000)
+    await ledger.close()
+
+    assert forecast["used"] < forecast["limit"]
+    assert forecast["pressure"] == 1.0
+
+    ranked = ProviderRouter({}).rank(
+        [DEEPL, LIBRE], "en", "de", quota_pressure={DEEPL.name: forecast["pressure"]}
+    )
+    assert ranked == [DEEPL, LIBRE]
+
+
+def test_quota_pressure_still_reorders_metered_providers():
+    ranked = ProviderRouter({}).rank(
+        [DEEPL, AZURE, LIBRE], "en", "de", quota_pressure={DEEPL.name: 1.0, AZURE.name: 0.0}
+    )
+    assert ranked == [AZURE, DEEPL, LIBRE]
+
+
+def test_unhealthy_metered_provider_can_still_rank_below_the_fallback():
+    router = ProviderRouter({})
+    for _ in range(20):
+        router.record(DEEPL.name, "en", "de", 5.0, False)
+
+    ranked = router.rank([DEEPL, LIBRE], "en", "de", quota_pressure={DEEPL.name: 0.0})
+    assert ranked == [LIBRE, DEEPL]
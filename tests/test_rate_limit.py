@@ -0,0 +1,50 @@
+"""Tests for the character-rate token bucket"""
+
+import asyncio
+
+import pytest
+
+from src.utils.rate_limit import TokenBucket
+
+
+async def test_text_longer_than_burst_is_admitted_from_a_full_bucket():
+    # Shipped DeepL settings; max_text_length is 10,000 characters
+    bucket = TokenBucket(rate=1000, capacity=5000)
+
+    waited = await bucket.acquire(10000, max_wait=2.0)
+
+    assert waited == 0
+    assert bucket.rejected == 0
+    assert bucket.tokens < 0
+
+
+async def test_text_longer_than_burst_waits_only_for_a_full_bucket():
+    bucket = TokenBucket(rate=1000, capacity=100)
+    await bucket.acquire(50)
+
+    waited = await bucket.acquire(2000, max_wait=1.0)
+
+    assert 0 < waited <= 0.1
+    assert bucket.rejected == 0
+
+
+async def test_debt_from_oversized_text_is_paid_by_later_callers():
+    bucket = TokenBucket(rate=1000, capacity=5000)
+    await bucket.acquire(10000, max_wait=2.0)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await bucket.acquire(100, max_wait=2.0)
+    assert bucket.rejected == 1
+
+
+async def test_cancelled_wait_refunds_tokens():
+    bucket = TokenBucket(rate=1000, capacity=100)
+    await bucket.acquire(100)
+
+    task = asyncio.create_task(bucket.acquire(100))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert bucket.tokens > 0
@@ -0,0 +1,54 @@
+"""Tests for single-flight request coalescing"""
+
+import asyncio
+
+import pytest
+
+from src.utils.single_flight import SingleFlight
+
+
+async def test_concurrent_callers_share_one_call():
+    flights = SingleFlight("test")
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*(flights.do("key", work) for _ in range(5)))
+
+    assert results == [1] * 5
+    assert flights.executed == 1
+    assert flights.coalesced == 4
+
+
+async def test_caller_after_last_waiter_cancelled_gets_a_fresh_call():
+    flights = SingleFlight("test")
+    started = 0
+
+    async def work():
+        nonlocal started
+        started += 1
+        try:
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            # Unwinding takes a few loop iterations, leaving a window to join
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            raise
+        return started
+
+    waiter_a = asyncio.create_task(flights.do("key", work))
+    await asyncio.sleep(0)
+    waiter_a.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter_a
+
+    # B arrives while A's shared task is still unwinding its cancellation
+    result = await flights.do("key", work)
+
+    assert result == 2
+    assert flights.executed == 2
+    assert flights.in_flight() == 0